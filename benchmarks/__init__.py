@@ -0,0 +1,5 @@
+"""
+FormScribe benchmark suite.
+
+Run it with 'python -m benchmarks.run'. See benchmarks/run.py for options.
+"""
@@ -0,0 +1,205 @@
+"""Benchmark cases, each one exercising a FormScribe hot path."""
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.columnar import validate_columns
+from formscribe.decorators import boolean
+from formscribe.decorators import integer
+from formscribe.decorators import oneof
+from formscribe.decorators import required
+from formscribe.error import ValidationError
+
+CASES = []
+
+
+def case(function):
+    """
+    Register a benchmark case.
+
+    A case is called once to set up its state, and must return the callable
+    being timed.
+    """
+
+    CASES.append(function)
+    return function
+
+
+def identity(self, value):
+    return value
+
+
+def make_form(name, fields, **attributes):
+    """Build a Form class out of a dict mapping names to Field attributes."""
+    for field_name, field_attributes in fields.items():
+        field_attributes.setdefault('validate', identity)
+        attributes[field_name] = type(field_name, (Field,), field_attributes)
+    return type(name, (Form,), attributes)
+
+
+class LoginForm(Form):
+    class Username(Field):
+        key = 'username'
+
+        def validate(self, value):
+            if not value:
+                raise ValidationError('The username is mandatory.')
+            return value
+
+    class Password(Field):
+        key = 'password'
+
+        def validate(self, value):
+            if not value or len(value) < 6:
+                raise ValidationError('The password is too short.')
+            return value
+
+    def submit(self, username, password):
+        pass
+
+
+class MatchingAndGroupingForm(Form):
+    class ProductName(Field):
+        regex_key = r'product-name-(\d+)'
+        regex_group = 'products'
+        regex_group_key = 'name'
+
+        def validate(self, value):
+            return value.strip()
+
+    class ProductDescription(Field):
+        regex_key = r'product-description-(\d+)'
+        regex_group = 'products'
+        regex_group_key = 'description'
+
+        def validate(self, value):
+            return value.strip()
+
+    def submit(self, products):
+        pass
+
+
+class DecoratedForm(Form):
+    @required('Age is required.')
+    @integer('Age must be an integer.')
+    class Age(Field):
+        key = 'age'
+
+        def validate(self, value):
+            return value
+
+    @required('Race is required.')
+    @oneof(['elf', 'orc', 'human'], 'Invalid race.')
+    class Race(Field):
+        key = 'race'
+
+        def validate(self, value):
+            return value
+
+    @boolean
+    class Enabled(Field):
+        key = 'enabled'
+
+        def validate(self, value):
+            return value
+
+
+WideForm = make_form('WideForm', dict(
+    ('Field%03d' % index, {'key': 'field-%03d' % index})
+    for index in range(200)))
+
+ChainForm = make_form('ChainForm', dict(
+    ('Link%03d' % index,
+     {'key': 'link-%03d' % index,
+      'when_validated': ['link-%03d' % (index + 1)] if index < 199 else []})
+    for index in range(200)))
+
+FanOutFields = dict(
+    ('Leaf%03d' % index, {'key': 'leaf-%03d' % index,
+                          'when_value': {'mode': 'on'}})
+    for index in range(200))
+FanOutFields['Mode'] = {'key': 'mode'}
+FanOutForm = make_form('FanOutForm', FanOutFields)
+
+CompiledWideForm = make_form('CompiledWideForm', dict(
+    ('Field%03d' % index, {'key': 'field-%03d' % index})
+    for index in range(200)), compiled=True)
+
+CompiledFanOutForm = make_form('CompiledFanOutForm', dict(
+    (name, dict(attributes)) for name, attributes in FanOutFields.items()),
+    compiled=True)
+
+
+@case
+def login_form():
+    data = {'username': 'john', 'password': 'secret-password'}
+    return lambda: LoginForm(data)
+
+
+@case
+def wide_form_200_fields():
+    data = dict(('field-%03d' % index, index) for index in range(200))
+    return lambda: WideForm(data)
+
+
+@case
+def compiled_wide_form_200_fields():
+    data = dict(('field-%03d' % index, index) for index in range(200))
+    return lambda: CompiledWideForm(data)
+
+
+@case
+def payload_5000_keys():
+    data = dict(('unrelated-%d' % index, index) for index in range(4998))
+    data.update({'username': 'john', 'password': 'secret-password'})
+    return lambda: LoginForm(data)
+
+
+@case
+def when_validated_chain_200():
+    data = dict(('link-%03d' % index, index) for index in range(200))
+    return lambda: ChainForm(data)
+
+
+@case
+def when_value_fan_out_200():
+    data = dict(('leaf-%03d' % index, index) for index in range(200))
+    data['mode'] = 'on'
+    return lambda: FanOutForm(data)
+
+
+@case
+def compiled_when_value_fan_out_200():
+    data = dict(('leaf-%03d' % index, index) for index in range(200))
+    data['mode'] = 'on'
+    return lambda: CompiledFanOutForm(data)
+
+
+@case
+def regex_grouping_5000_keys():
+    data = {}
+    for index in range(2500):
+        data['product-name-%d' % index] = ' name %d ' % index
+        data['product-description-%d' % index] = ' description %d ' % index
+    return lambda: MatchingAndGroupingForm(data)
+
+
+@case
+def decorator_stacks():
+    data = {'age': '25', 'race': 'orc', 'enabled': '1'}
+    return lambda: DecoratedForm(data)
+
+
+@case
+def validate_many_1000_rows():
+    rows = [{'username': 'user-%d' % index, 'password': 'secret-password'}
+            for index in range(1000)]
+    return lambda: list(LoginForm.validate_many(rows))
+
+
+@case
+def columnar_20000_rows():
+    size = 20000
+    columns = {'age': [str(index % 100) for index in range(size)],
+               'race': ['orc'] * size,
+               'enabled': ['1'] * size}
+    return lambda: validate_columns(DecoratedForm, columns)
@@ -0,0 +1,118 @@
+"""
+Run the FormScribe benchmark suite.
+
+Results are stored as JSON files, named after the current commit by default,
+so that runs made on different commits can be compared:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --compare benchmarks/results/<commit>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+from benchmarks.cases import CASES
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def get_commit():
+    """Retrieve the current git commit, or None outside of a repository."""
+    try:
+        output = subprocess.check_output(['git', 'rev-parse', '--short',
+                                          'HEAD'], stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def measure(function, repeat, min_time):
+    """
+    Time a callable.
+
+    The number of calls per measurement is increased until a measurement
+    takes at least 'min_time' seconds.
+
+    Returns:
+        dict: best and median time per call, in seconds.
+    """
+
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    timings = sorted(timing / number
+                     for timing in timer.repeat(repeat, number))
+    return {
+        'best': timings[0],
+        'median': timings[len(timings) // 2],
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def run(cases, repeat, min_time):
+    results = {}
+    for case in cases:
+        results[case.__name__] = measure(case(), repeat, min_time)
+        sys.stdout.write('%-30s %12.1f us\n' % (
+            case.__name__, results[case.__name__]['best'] * 1e6))
+    return results
+
+
+def compare(results, baseline):
+    sys.stdout.write('\n%-30s %12s %12s %8s\n' % ('case', 'baseline',
+                                                  'current', 'ratio'))
+    for name, result in sorted(results.items()):
+        try:
+            before = baseline['results'][name]['best']
+        except KeyError:
+            continue
+        sys.stdout.write('%-30s %9.1f us %9.1f us %7.2fx\n' % (
+            name, before * 1e6, result['best'] * 1e6,
+            result['best'] / before))
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-k', dest='pattern', default='',
+                        help='only run cases whose name contains PATTERN')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of measurements per case')
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='minimal duration of a measurement, in seconds')
+    parser.add_argument('--output', help='file results are stored in')
+    parser.add_argument('--compare', help='results file to compare against')
+    options = parser.parse_args(arguments)
+
+    cases = [case for case in CASES if options.pattern in case.__name__]
+    commit = get_commit()
+    report = {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run(cases, options.repeat, options.min_time),
+    }
+
+    output = options.output
+    if not output:
+        if not os.path.isdir(RESULTS_DIRECTORY):
+            os.makedirs(RESULTS_DIRECTORY)
+        output = os.path.join(RESULTS_DIRECTORY,
+                              '%s.json' % (commit or 'unknown'))
+    with open(output, 'w') as results_file:
+        json.dump(report, results_file, indent=2, sort_keys=True)
+    sys.stdout.write('\nResults stored in %s\n' % output)
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            compare(report['results'], json.load(baseline_file))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,20 +5,34 @@ post-validation actions, has a built-in type validation system,
 and is easily extensible.
 """
 
-import re
 from operator import itemgetter
+from timeit import default_timer
 
 import six
 
+from formscribe.body import parse_body
+from formscribe.codegen import compile_validator
+from formscribe.error import LimitExceededError
 from formscribe.error import SubmitError
 from formscribe.error import ValidationError
 from formscribe.meta import MetaField
-from formscribe.util import get_attributes
-
-try:
-    from collections import OrderedDict
-except ImportError:
-    from ordereddict import OrderedDict
+from formscribe.meta import MetaForm
+from formscribe.parallel import validate_parallel
+from formscribe.result import ERROR
+from formscribe.result import NOT_EVALUATED
+from formscribe.result import Result
+from formscribe.result import SKIPPED_DEPENDENCY
+from formscribe.result import SKIPPED_DISABLED
+from formscribe.result import SKIPPED_VALUE
+from formscribe.result import VALIDATED
+from formscribe.schema import Schema
+from formscribe.util import MappingProxyType
+from formscribe.util import Overlay
+
+# execution modes, see Form.mode
+VALIDATE_FIELDS = 'validate-fields'
+VALIDATE = 'validate'
+SUBMIT = 'submit'
 
 
 class Field(six.with_metaclass(MetaField, object)):
@@ -35,13 +49,25 @@ class Field(six.with_metaclass(MetaField, object)):
                                field to be validated.
                                Dependencies are matched based on the 'key'
                                attribute of other Field objects.
+        max_matches (int): when set on a regex-based field, payloads holding
+                           more keys matching its 'regex_key' are rejected.
+                           See Form.max_keys.
+        concurrent_submit (bool): whether submit() is independent from other
+                                  fields' submits, so that it may run in a
+                                  separate thread. See Form.submit_workers.
+        stateless (bool): whether instances of this Field hold no state of
+                          their own, so that a single instance may be shared
+                          by every Form object.
     """
 
+    concurrent_submit = False
     enabled = True
     key = None
+    max_matches = None
     regex_group = None
     regex_group_key = None
     regex_key = None
+    stateless = False
     when_validated = []
     when_value = {}
 
@@ -83,145 +109,727 @@ class Field(six.with_metaclass(MetaField, object)):
         raise NotImplementedError()
 
 
-class Form(object):
+class Form(six.with_metaclass(MetaForm, object)):
+    """
+    Represents an HTML form.
+
+    Attributes:
+        compiled (bool): whether fields are validated by a function generated
+                         for this Form class, rather than by the generic
+                         validation loop. See formscribe.codegen. The generic
+                         loop is still used whenever an observer or an error
+                         budget is set, or when the class overrides one of
+                         the field validation methods.
+        error_budget (int): when set, validation stops as soon as this many
+                            errors were recorded. The remaining fields are
+                            left unevaluated, and the form itself is neither
+                            validated nor submitted. It must be at least 1.
+                            formscribe.aio honours it as well.
+        max_keys (int): when set, payloads holding more keys are rejected.
+        max_groups (int): when set, payloads creating more regex group
+                          entries, over every regex group, are rejected.
+                          Limits are enforced in a single scan of the keys,
+                          which stops as soon as one of them is exceeded,
+                          before any field is validated. A rejected payload
+                          only gets a LimitExceededError.
+        mode (str): phases a payload goes through. VALIDATE_FIELDS only
+                    validates the fields, VALIDATE also validates the form
+                    itself, and SUBMIT, the default, also submits the fields
+                    and the form when everything is valid.
+        observer (Observer): when set, notified of every field processed by
+                             the validation loop, or by formscribe.aio. See
+                             formscribe.instrumentation.
+        submit_workers (int): when set, fields whose 'concurrent_submit'
+                              attribute is True are submitted concurrently,
+                              over a pool of this many threads, created once
+                              per Form class.
+    """
+
+    compiled = False
+    error_budget = None
+    max_groups = None
+    max_keys = None
+    mode = SUBMIT
+    observer = None
+    submit_workers = None
+
     def __init__(self, data, **kwargs):
-        self.data = OrderedDict(sorted(data.items(), key=itemgetter(0)))
+        # set kwargs-based attributes
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+        self.process(data)
+
+    @classmethod
+    def from_body(cls, body, content_type, **kwargs):
+        """
+        Validate and submit a raw request body against this Form class.
+
+        The body is parsed against this Form class' schema, so that values no
+        field reads are skipped. See formscribe.body.
+
+        Args:
+            body (bytes): application/x-www-form-urlencoded or
+                          multipart/form-data body. Multipart bodies may also
+                          be file-like objects, read chunk by chunk.
+            content_type (str): the request's Content-Type header.
+            **kwargs: attributes set on the Form object, just like the
+                      keyword arguments of a regular Form.
+
+        Returns:
+            Form: the processed Form object.
+
+        Raises:
+            MalformedBodyError: the body can't be parsed, or its content type
+                                isn't supported.
+        """
+
+        return cls(parse_body(cls.get_schema(), body, content_type), **kwargs)
+
+    @classmethod
+    def validate_many(cls, rows, **kwargs):
+        """
+        Validate and submit many payloads against this Form class.
+
+        A single Form object is created and reused for every row, instead of
+        building a new one per row.
+
+        Args:
+            rows (iterable): dict-like objects, each one being processed just
+                             like the 'data' argument of a regular Form.
+            **kwargs: attributes set on the Form object, just like the
+                      keyword arguments of a regular Form.
+
+        Yields:
+            Result: the outcome of each row, in order.
+        """
+
+        form = cls.__new__(cls)
+        for key, value in kwargs.items():
+            setattr(form, key, value)
+        for data in rows:
+            form.process(data)
+            yield form.get_result()
+
+    @classmethod
+    def validate_stream(cls, records, **kwargs):
+        """
+        Lazily validate and submit an unbounded stream of payloads.
+
+        Records are pulled from 'records' only as results are consumed, so
+        memory usage doesn't depend on the stream's length. Records are
+        processed one by one, by a single Form object, see validate_many().
+
+        Args:
+            records (iterable): dict-like objects, e.g. CSV rows or decoded
+                                JSON lines read from a file.
+            **kwargs: attributes set on the Form object, just like the
+                      keyword arguments of a regular Form.
+
+        Returns:
+            generator: yields a Result object for each record, in order.
+        """
+
+        return cls.validate_many(records, **kwargs)
+
+    @classmethod
+    def validate_parallel(cls, rows, processes=None, chunk_size=100,
+                          ordered=True, **kwargs):
+        """
+        Validate and submit many payloads over a pool of worker processes.
+
+        See formscribe.parallel.validate_parallel().
+        """
+
+        return validate_parallel(cls, rows, processes=processes,
+                                 chunk_size=chunk_size, ordered=ordered,
+                                 **kwargs)
+
+    def process(self, data):
+        """
+        Validate and submit a payload, going through the phases selected by
+        the 'mode' attribute.
+
+        Any state left by a previous payload is discarded first, so the same
+        Form object may process several payloads in a row.
+
+        Args:
+            data (dict): dict-like object holding the submitted data.
+
+        Raises:
+            ValueError: 'error_budget' is set, but isn't at least 1.
+        """
+
+        budget = self.get_error_budget()
+        self.reset(data)
+        if not self.enforce_limits():
+            return
+        schema = self._schema
+
+        # validate all fields, dependencies first
+        observer = self.observer
+        validator = None
+        if self.compiled and budget is None and observer is None:
+            validator = self.get_validator()
+        if validator is not None:
+            validator(self)
+        else:
+            for field in schema.plan:
+                if observer is None:
+                    self.validate_field(field)
+                else:
+                    self.observe_field(field, observer)
+                if budget is not None and len(self.errors) >= budget:
+                    self.aborted = True
+                    break
+
+        if self.mode == VALIDATE_FIELDS or self.aborted:
+            return
+
+        # validate the form itself
+        self.validate_form()
+
+        # submit the form
+        if self.mode == SUBMIT and not self.errors:
+            self.submit_fields()
+            if schema.submits:
+                try:
+                    self.submit(**self.get_arguments(
+                        schema.submit_parameters))
+                except SubmitError as error:
+                    self.errors.append(error)
+                except NotImplementedError:
+                    pass
+            self.submitted = not self.errors
+
+    def get_error_budget(self):
+        """
+        Get the error budget, checking it first.
+
+        Returns:
+            int: the error budget, or None when it isn't set.
+
+        Raises:
+            ValueError: the error budget is set, but isn't at least 1.
+        """
+
+        budget = self.error_budget
+        if budget is not None and budget < 1:
+            raise ValueError('error_budget must be at least 1, got %r.'
+                             % (budget,))
+        return budget
+
+    def revalidate(self, changes):
+        """
+        Incrementally validate a previously processed payload again, after
+        some of its values changed.
+
+        Only the fields reading a changed key, and the fields depending on
+        them, directly or not, are validated again. A regex group is
+        validated again as a whole whenever one of its fields has to. Every
+        other field keeps its previous value and errors. Unless 'mode' is
+        VALIDATE_FIELDS, the form itself is then validated again, but
+        nothing is submitted. When the previous run was aborted by the error
+        budget, the fields it left unevaluated are validated as well.
+
+        Args:
+            changes (dict): changed or added keys, mapped to their new
+                            values. The previous data isn't modified.
+
+        Returns:
+            set: the Field classes that were validated again.
+
+        Raises:
+            ValueError: 'error_budget' is set, but isn't at least 1.
+        """
+
+        budget = self.get_error_budget()
+        schema = self._schema
+        self.data = Overlay(self.data, changes)
+        self.submitted = False
+        self.arguments = None
+        if not self.enforce_limits():
+            # a rejected payload only gets the LimitExceededError
+            error = self.errors[-1]
+            self.reset(self.data)
+            self.errors.append(error)
+            self.aborted = True
+            return set()
+
+        dirty = set()
+        for key in changes:
+            dirty.update(schema.key_fields.get(key, ()))
+        for field, routes in schema.dispatcher.dispatch(changes).items():
+            if routes:
+                dirty.add(field)
+                # keys are only routed once a regex field needs them
+                if self.regex_routes is not None:
+                    known = set(key for key, _ in self.regex_routes[field])
+                    self.regex_routes[field].extend(
+                        route for route in routes if route[0] not in known)
+
+        # an aborted run left fields unevaluated, and may have stopped a
+        # regex field's scan midway
+        if self.aborted:
+            dirty.update(self.unevaluated)
+            dirty.update(field for field in self.error_fields
+                         if field.regex_key)
+
+        # fields depending on a dirty field are dirty as well
+        pending = list(dirty)
+        while pending:
+            for dependent in schema.dependents[pending.pop()]:
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    pending.append(dependent)
+
+        for group in set(field.regex_group for field in dirty
+                         if field.regex_key):
+            self.regex_values[group] = {}
+            dirty.update(schema.group_fields[group])
+
+        # keep the errors of fields that aren't dirty, dropping the form's
+        previous_errors = {}
+        for error, field in zip(self.errors, self.error_fields):
+            if field not in dirty:
+                previous_errors.setdefault(field, []).append(error)
         self.errors = []
-        self.invalidated = []
+        self.error_fields = []
+
+        for field in dirty:
+            self.status[schema.positions[field]] = NOT_EVALUATED
+            self.values.pop(field, None)
+
+        self.aborted = False
+        observer = self.observer
+        for field in schema.plan:
+            if field not in dirty:
+                for error in previous_errors.get(field, ()):
+                    self.add_error(field, error)
+            elif observer is None:
+                self.validate_field(field)
+            else:
+                self.observe_field(field, observer)
+            if budget is not None and len(self.errors) >= budget:
+                self.aborted = True
+                break
+
+        if self.mode != VALIDATE_FIELDS and not self.aborted:
+            self.validate_form()
+        return dirty
+
+    def reset(self, data):
+        """
+        Discard any previous state and load a new payload.
+
+        Args:
+            data (dict): dict-like object holding the submitted data.
+        """
+
+        if not hasattr(self, 'field_instances'):
+            self.field_instances = {}
+        # the data is read in place: key-based fields only need lookups,
+        # and only the keys matched by regex fields are ever sorted
+        self.data = data
+        self.errors = []
+        # field each entry of 'errors' was raised by, during field validation
+        self.error_fields = []
         self.regex_values = {}
-        self.validated = []
+        self.submitted = False
         self.values = {}
 
-        # set kwargs-based attributes
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        schema = self._schema
+        # status of each field, indexed by its position in the schema
+        self.status = bytearray(len(schema.fields))
+        for group in schema.regex_groups:
+            self.regex_values[group] = {}
+        # data keys are routed to regex fields on first use
+        self.regex_routes = None
+        self.arguments = None
+        self.aborted = False
+
+    def enforce_limits(self):
+        """
+        Check the payload against the 'max_keys' and 'max_groups' limits, and
+        against the regex fields' 'max_matches' limits.
+
+        When any limit is set, data keys are routed to regex fields right
+        away, by the scan enforcing them.
+
+        Returns:
+            bool: False when a limit was exceeded, in which case the
+                  LimitExceededError is recorded, and validation aborted.
+        """
+
+        dispatcher = self._schema.dispatcher
+        if (self.max_keys is None and self.max_groups is None and
+                not dispatcher.limited):
+            return True
+        try:
+            self.regex_routes = dispatcher.dispatch(self.data, self.max_keys,
+                                                    self.max_groups)
+        except LimitExceededError as error:
+            self.errors.append(error)
+            self.aborted = True
+            return False
+        return True
+
+    def submit_fields(self):
+        """
+        Submit every validated field value.
+
+        Fields are submitted in field order. When 'submit_workers' is set,
+        fields declaring 'concurrent_submit' are instead submitted over the
+        Form class' thread pool, see Schema.get_submit_pool(), while the
+        others are submitted by the current thread.
+        Either way, SubmitError objects are collected in field order, and
+        this method only returns once every field was submitted.
+        """
 
-        # validate all fields and their dependencies
-        fields = self.get_fields()
-        for field in fields:
-            # instantiate the field so its InvalidFieldError exceptions
-            # are raised
-            field(automatically_validate=False)
-            if field.regex_key and (field.regex_group not in self.regex_values):
-                self.regex_values[field.regex_group] = {}
+        pending = [(field, value) for field, value in self.values.items()
+                   if value is not None]
+        concurrent = []
+        if self.submit_workers:
+            concurrent = [(field, value) for field, value in pending
+                          if field.concurrent_submit]
+
+        outcomes = {}
+        if concurrent:
+            pool = self._schema.get_submit_pool(self.submit_workers)
+            results = pool.map_async(
+                lambda item: self.submit_field(*item), concurrent)
             try:
-                self.validate_field(field)
-            except ValidationError:
-                pass
+                for field, value in pending:
+                    if not field.concurrent_submit:
+                        outcomes[field] = self.submit_field(field, value)
+            finally:
+                # the pool outlives this call, which must not return while
+                # it still uses this Form object
+                results.wait()
+            outcomes.update(zip([field for field, _ in concurrent],
+                                results.get()))
+        else:
+            for field, value in pending:
+                outcomes[field] = self.submit_field(field, value)
+
+        for field, _ in pending:
+            if outcomes[field] is not None:
+                self.errors.append(outcomes[field])
+
+    def submit_field(self, field, value):
+        """
+        Submit a single field value.
+
+        Returns:
+            SubmitError: the error raised by the field, if any.
+        """
 
-        # validate the form itself
         try:
-            self.validate(**self.build_kwargs())
+            self.get_field_instance(field).submit(value)
+        except SubmitError as error:
+            return error
+        except NotImplementedError:
+            pass
+
+    def get_regex_routes(self, field):
+        """
+        Retrieve the data keys matched by a regex field, sorted by key.
+
+        Returns:
+            list: (key, matches) tuples, as built by RegexDispatcher.
+        """
+
+        if self.regex_routes is None:
+            self.regex_routes = self._schema.dispatcher.dispatch(self.data)
+        routes = self.regex_routes[field]
+        routes.sort(key=itemgetter(0))
+        return routes
+
+    def get_field_instance(self, field):
+        """
+        Retrieve the instance of a Field class used by this Form object.
+
+        Instances are created on first use, and then reused for every
+        operation and every payload processed by this Form object. Stateless
+        fields share a single instance across all Form objects.
+        """
+
+        if field.stateless:
+            instances = self._schema.field_instances
+        else:
+            instances = self.field_instances
+        try:
+            return instances[field]
+        except KeyError:
+            instance = instances[field] = field(automatically_validate=False)
+            return instance
+
+    def validate_form(self):
+        """Validate the form itself, through its validate() method."""
+        schema = self._schema
+        if not schema.validates:
+            return
+        try:
+            self.validate(**self.get_arguments(schema.validate_parameters))
         except ValidationError as error:
             self.errors.append(error)
         except NotImplementedError:
             pass
 
-        # submit the form
-        if not self.errors:
-            for field, value in self.values.items():
-                if value is not None:
-                    try:
-                        field(automatically_validate=False).submit(value)
-                    except SubmitError as error:
-                        self.errors.append(error)
-                    except NotImplementedError:
-                        pass
-            try:
-                self.submit(**self.build_kwargs())
-            except SubmitError as error:
-                self.errors.append(error)
-            except NotImplementedError:
-                pass
+    def add_error(self, field, error):
+        """Record a ValidationError raised, or returned, by a field."""
+        self.errors.append(error)
+        self.error_fields.append(field)
+
+    def get_result(self):
+        """Retrieve the outcome of the last processed payload."""
+        return Result(self.build_kwargs(), self.errors, self.submitted,
+                      bytes(self.status))
+
+    def get_status(self, field):
+        """Retrieve a field's status code, as defined by formscribe.result."""
+        return self.status[self._schema.positions[field]]
+
+    @property
+    def validated(self):
+        """Set of the fields which were enabled when validation began."""
+        fields = self._schema.fields
+        return set(fields[position] for position, status
+                   in enumerate(self.status)
+                   if status not in (NOT_EVALUATED, SKIPPED_DISABLED))
+
+    @property
+    def unevaluated(self):
+        """
+        List of the fields which were never evaluated, because validation
+        was aborted once the error budget ran out.
+        """
+
+        return [field for field in self._schema.fields
+                if self.status[self._schema.positions[field]] ==
+                NOT_EVALUATED]
+
+    @property
+    def invalidated(self):
+        """Set of the fields which failed to validate."""
+        fields = self._schema.fields
+        return set(fields[position] for position, status
+                   in enumerate(self.status) if status == ERROR)
+
+    def build_kwargs(self, names=None):
+        """
+        Build the keyword arguments of the validate() and submit() methods.
+
+        Args:
+            names (frozenset): when set, only the arguments with these names
+                               are built.
+
+        Returns:
+            dict: maps the lowercased class name of each key-based field to
+                  its value, and each regex group to the list of its
+                  entries. Every entry is a new dict, which also holds the
+                  entry's 'matches'.
+        """
 
-    def build_kwargs(self):
-        kwargs = dict((field.__name__.lower(), value)
-                      for field, value in self.values.items())
-        for group, matches_values in self.regex_values.items():
-            for matches, values in matches_values.items():
-                values['matches'] = list(matches)
-            kwargs[group] = list(matches_values.values())
+        argument_names = self._schema.argument_names
+        kwargs = {}
+        for field, value in self.values.items():
+            name = argument_names[field]
+            if names is None or name in names:
+                kwargs[name] = value
+        for group, entries in self.regex_values.items():
+            if names is None or group in names:
+                kwargs[group] = [dict(values, matches=list(matches))
+                                 for matches, values in entries.items()]
         return kwargs
 
+    def get_arguments(self, parameters):
+        """
+        Retrieve the keyword arguments of the validate() or submit() method.
+
+        Arguments are built once per payload, only for the parameters either
+        method accepts, and are then shared by both methods as a read-only
+        mapping.
+
+        Args:
+            parameters (frozenset): parameters the method accepts, or None
+                                    for any.
+
+        Returns:
+            Mapping: the arguments.
+        """
+
+        arguments = self.arguments
+        if arguments is None:
+            arguments = self.arguments = MappingProxyType(
+                self.build_kwargs(self._schema.parameters))
+        if parameters is None or parameters == self._schema.parameters:
+            return arguments
+        return dict((name, arguments[name]) for name in parameters
+                    if name in arguments)
+
+    @classmethod
+    def compile_schema(cls):
+        """
+        Build the Schema shared by every instance of this Form class.
+
+        Called once by MetaForm, whenever a Form class is created.
+        """
+
+        return Schema(cls)
+
+    @classmethod
+    def get_schema(cls):
+        """Retrieve the compiled Schema of this Form class."""
+        return cls._schema
+
+    @classmethod
+    def get_validator(cls):
+        """
+        Retrieve the generated field validation function of this Form class.
+
+        It is generated on first use, and then cached on the class.
+
+        Returns:
+            function: see formscribe.codegen.compile_validator(), or None when
+                      the class overrides one of the field validation methods,
+                      which the generated function would bypass.
+        """
+
+        try:
+            return cls.__dict__['_validator']
+        except KeyError:
+            pass
+
+        validator = None
+        if all(getattr(cls, name) == getattr(Form, name) for name in
+               ('add_error', 'execute_field', 'prepare_field',
+                'validate_field')):
+            validator = compile_validator(cls)
+        cls._validator = validator
+        return validator
+
     def get_fields(self):
-        fields = []
-        for attribute in get_attributes(self):
-            try:
-                if issubclass(attribute, Field):
-                    fields.append(attribute)
-            except TypeError:
-                pass
-        return fields
+        return list(self._schema.fields)
 
     def get_field_dependencies(self, field):
-        dependencies = []
-        dependencies_keys = set(field.when_validated +
-                                list(field.when_value.keys()))
-        for possible_dependency in self.get_fields():
-            if possible_dependency.key in dependencies_keys:
-                dependencies.append(possible_dependency)
-        return dependencies
+        return self._schema.dependencies[field]
+
+    def prepare_field(self, field):
+        """
+        Decide whether a field should be validated.
+
+        Marks the field as validated and sets its default value. Its
+        dependencies must have already been validated.
+
+        Returns:
+            int: None if the field should be validated. Otherwise, the
+                 status code explaining why it shouldn't, as defined by
+                 formscribe.result.
+        """
+
+        schema = self._schema
+        position = schema.positions[field]
+        status = self.status
 
-    def validate_field(self, field):
         # no need to revalidate if field was already validated
-        if field in self.validated:
-            return
+        if status[position]:
+            return status[position]
 
         # bail out if the 'enabled' callable/attribute is not True
-        instance = field(automatically_validate=False)
+        instance = self.get_field_instance(field)
         try:
             enabled = instance.enabled()
         except TypeError:
             enabled = instance.enabled
         if not enabled:
-            return
+            status[position] = SKIPPED_DISABLED
+            return SKIPPED_DISABLED
 
         # make sure this field isn't validated twice
-        self.validated.append(field)
+        status[position] = VALIDATED
 
         # it field is key-based, set its default value to None
         if field.key:
             self.values[field] = None
 
-        # validate the field's dependencies first
-        for dependency in self.get_field_dependencies(field):
-            # dependencies also must not be validated if they already were
-            if dependency not in self.validated:
-                self.validate_field(dependency)
+        # dependencies have already been handled, since fields are
+        # validated following the schema's plan
+        for dependency in schema.dependencies[field]:
             try:
                 if field.when_value[dependency.key] != self.values[dependency]:
-                    return
+                    status[position] = SKIPPED_VALUE
+                    return SKIPPED_VALUE
             except KeyError:
                 pass
 
         # do not validate the field if one of its dependencies
         # couldn't be validated
-        if any(dependency in self.invalidated for dependency in
-               self.get_field_dependencies(field)):
-            return
+        for dependency_position in schema.dependency_positions[field]:
+            if status[dependency_position] == ERROR:
+                status[position] = SKIPPED_DEPENDENCY
+                return SKIPPED_DEPENDENCY
+
+    def validate_field(self, field):
+        if self.prepare_field(field) is None:
+            return self.execute_field(field)
+
+    def observe_field(self, field, observer):
+        """Validate a field, notifying an observer of its outcome."""
+        started = default_timer()
+        matches = 0
+        outcome = self.prepare_field(field)
+        if outcome is None:
+            self.execute_field(field)
+            outcome = self.get_status(field)
+            if field.regex_key:
+                matches = len(self.regex_routes[field])
+        observer.field_finished(self, field, outcome, started, default_timer(),
+                                matches)
+
+    def execute_field(self, field):
+        """
+        Validate a field which is ready to be validated.
+
+        Its value, or its errors, are stored in the Form object's state.
+
+        Besides raising a ValidationError, a field's validate() method may
+        also return one, which avoids the cost of raising an exception.
+        """
 
-        # validate the field itself
         if field.key:  # normal validation
             try:
-                value = field(value=self.data.get(field.key),
-                              automatically_validate=True)
+                value = self.get_field_instance(field).validate(
+                    self.data.get(field.key))
+            except ValidationError as error:
+                value = error
+            if isinstance(value, ValidationError):
+                self.add_error(field, value)
+                self.status[self._schema.positions[field]] = ERROR
+            else:
                 self.values[field] = value
                 return value
-            except ValidationError as error:
-                self.errors.append(error)
-                self.invalidated.append(field)
         elif field.regex_key:  # regex-based validation
-            group = field.regex_group
-            for key, value in self.data.items():
-                all_matches = re.findall(field.regex_key, key)
-                if all_matches:
-                    try:
-                        value = field(value=value, automatically_validate=True)
-                        if tuple(all_matches) not in self.regex_values[group]:
-                            self.regex_values[group][tuple(all_matches)] = {}
-                        self.regex_values[group][tuple(all_matches)][field.regex_group_key] = value
-                    except ValidationError as error:
-                        self.errors.append(error)
+            instance = self.get_field_instance(field)
+            group = self.regex_values[field.regex_group]
+            errors = len(self.errors)
+            for key, matches in self.get_regex_routes(field):
+                try:
+                    value = instance.validate(self.data[key])
+                except ValidationError as error:
+                    value = error
+                if isinstance(value, ValidationError):
+                    self.add_error(field, value)
+                    budget = self.error_budget
+                    if budget is not None and len(self.errors) >= budget:
+                        self.aborted = True
+                        break
+                else:
+                    if matches not in group:
+                        group[matches] = {}
+                    group[matches][field.regex_group_key] = value
+            if len(self.errors) > errors:
+                self.status[self._schema.positions[field]] = ERROR
 
     def validate(self, *args, **kwargs):
         raise NotImplementedError()
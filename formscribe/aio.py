@@ -0,0 +1,225 @@
+"""
+asyncio support.
+
+Fields and Forms processed through this module may define their validate()
+and submit() methods as coroutines. Regular methods keep working as well.
+
+The error budget of a Form is honoured: once it runs out, the fields still
+being validated are cancelled. As fields are validated concurrently, more of
+them may have run than in Form.process(), but the outcome is the same:
+errors are reported in field order up to the budget, and the fields past
+that point are left unevaluated.
+
+A Form's observer is notified of every field as well. As fields are
+validated concurrently, the duration it receives for a field includes the
+time spent running other coroutines while the field was awaiting.
+
+Requires Python 3.5 or newer.
+"""
+
+import asyncio
+import inspect
+from timeit import default_timer
+
+from formscribe import SUBMIT
+from formscribe import VALIDATE_FIELDS
+from formscribe.error import SubmitError
+from formscribe.error import ValidationError
+from formscribe.result import ERROR
+from formscribe.result import NOT_EVALUATED
+
+
+async def resolve(value):
+    """Await 'value' if it is awaitable, or return it as is otherwise."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def validate_async(form_class, data, **kwargs):
+    """
+    Asynchronous counterpart of instantiating a Form.
+
+    Args:
+        form_class (type): Form class.
+        data (dict): dict-like object holding the submitted data.
+        **kwargs: attributes set on the Form object.
+
+    Returns:
+        Form: the processed Form object.
+    """
+
+    form = form_class.__new__(form_class)
+    for key, value in kwargs.items():
+        setattr(form, key, value)
+    await process(form, data)
+    return form
+
+
+async def process(form, data):
+    """
+    Asynchronous counterpart of Form.process().
+
+    Fields with no dependency between them are validated concurrently, while
+    every field still waits for its own dependencies first. Errors are
+    reported in the same order Form.process() would report them.
+
+    Field submits are awaited one by one, in field order, as their side
+    effects may depend on each other.
+
+    Args:
+        form (Form): Form object.
+        data (dict): dict-like object holding the submitted data.
+
+    Raises:
+        ValueError: 'error_budget' is set, but isn't at least 1.
+    """
+
+    budget = form.get_error_budget()
+    form.reset(data)
+    if not form.enforce_limits():
+        return
+    schema = form.get_schema()
+
+    observer = form.observer
+    field_errors = dict((field, []) for field in schema.plan)
+    finished = set()
+    tasks = {}
+    recorded = [0]
+
+    async def run(field):
+        for dependency in schema.dependencies[field]:
+            await tasks[dependency]
+        errors = field_errors[field]
+        started = default_timer()
+        outcome = await validate_field(form, field, errors)
+        finished.add(field)
+        if observer is not None:
+            matches = 0
+            if outcome is None:
+                outcome = form.get_status(field)
+                if field.regex_key:
+                    matches = len(form.regex_routes[field])
+            observer.field_finished(form, field, outcome, started,
+                                    default_timer(), matches)
+        if budget is not None and errors:
+            recorded[0] += len(errors)
+            if recorded[0] >= budget:
+                for task in tasks.values():
+                    if task is not tasks[field]:
+                        task.cancel()
+
+    # the plan lists dependencies first, so every task a field waits for
+    # already exists when it is scheduled
+    for field in schema.plan:
+        tasks[field] = asyncio.ensure_future(run(field))
+    for outcome in await asyncio.gather(*tasks.values(),
+                                        return_exceptions=True):
+        if isinstance(outcome, BaseException) and \
+                not isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+
+    for field in schema.plan:
+        if form.aborted or field not in finished:
+            discard_field(form, field)
+            continue
+        for error in field_errors[field]:
+            form.add_error(field, error)
+            if budget is not None and len(form.errors) >= budget:
+                form.aborted = True
+                break
+
+    if form.mode == VALIDATE_FIELDS or form.aborted:
+        return
+
+    # validate the form itself
+    if schema.validates:
+        try:
+            await resolve(form.validate(**form.get_arguments(
+                schema.validate_parameters)))
+        except ValidationError as error:
+            form.errors.append(error)
+        except NotImplementedError:
+            pass
+
+    # submit the form
+    if form.mode == SUBMIT and not form.errors:
+        for field, value in list(form.values.items()):
+            if value is not None:
+                try:
+                    await resolve(
+                        form.get_field_instance(field).submit(value))
+                except SubmitError as error:
+                    form.errors.append(error)
+                except NotImplementedError:
+                    pass
+        if schema.submits:
+            try:
+                await resolve(form.submit(**form.get_arguments(
+                    schema.submit_parameters)))
+            except SubmitError as error:
+                form.errors.append(error)
+            except NotImplementedError:
+                pass
+        form.submitted = not form.errors
+
+
+def discard_field(form, field):
+    """
+    Mark a field as unevaluated, discarding any value it was validated to.
+
+    Used for the fields whose validation was cancelled, or whose outcome lies
+    past the point the error budget ran out.
+    """
+
+    form.status[form.get_schema().positions[field]] = NOT_EVALUATED
+    if field.key:
+        form.values.pop(field, None)
+    elif field.regex_key:
+        for entry in form.regex_values[field.regex_group].values():
+            entry.pop(field.regex_group_key, None)
+
+
+async def validate_field(form, field, errors):
+    """
+    Asynchronous counterpart of Form.validate_field().
+
+    Args:
+        form (Form): Form object.
+        field (type): Field class, whose dependencies were already validated.
+        errors (list): list the field's ValidationError objects are added to.
+
+    Returns:
+        int: None once the field was validated. Otherwise, the status code
+             returned by Form.prepare_field().
+    """
+
+    outcome = form.prepare_field(field)
+    if outcome is not None:
+        return outcome
+
+    instance = form.get_field_instance(field)
+    if field.key:
+        try:
+            value = await resolve(instance.validate(form.data.get(field.key)))
+        except ValidationError as error:
+            value = error
+        if isinstance(value, ValidationError):
+            errors.append(value)
+        else:
+            form.values[field] = value
+    elif field.regex_key:
+        group = form.regex_values[field.regex_group]
+        for key, matches in form.get_regex_routes(field):
+            try:
+                value = await resolve(instance.validate(form.data[key]))
+            except ValidationError as error:
+                value = error
+            if isinstance(value, ValidationError):
+                errors.append(value)
+            else:
+                if matches not in group:
+                    group[matches] = {}
+                group[matches][field.regex_group_key] = value
+    if errors:
+        form.status[form.get_schema().positions[field]] = ERROR
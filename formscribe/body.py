@@ -0,0 +1,306 @@
+"""
+Raw request body parsing.
+
+Bodies are parsed straight into the data a Form reads, against its compiled
+Schema: keys no field, key-based or regex-based, reads are skipped without
+their values being decoded. Multipart bodies are read chunk by chunk, so
+that the values of skipped parts are never held in memory, and files are
+spooled to disk as they are read, see formscribe.upload.
+
+Whenever a key is repeated, its first value is kept, just like the get()
+method of the MultiDict objects web frameworks provide.
+"""
+
+import io
+import re
+
+from six.moves.urllib.parse import unquote_to_bytes
+
+from formscribe.error import MalformedBodyError
+
+URLENCODED = 'application/x-www-form-urlencoded'
+MULTIPART = 'multipart/form-data'
+
+CHUNK_SIZE = 64 * 1024
+MAX_HEADER_SIZE = 16 * 1024
+
+OPTION = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+ESCAPE = re.compile(r'\\(.)')
+
+
+def parse_options_header(value):
+    """
+    Split a header value, such as 'multipart/form-data; boundary=x', into
+    its main value and its options.
+
+    Returns:
+        tuple: the lowercased main value, and a dict mapping lowercased
+               option names to their unquoted values.
+    """
+
+    main, _, rest = value.partition(';')
+    options = {}
+    for name, option in OPTION.findall(';' + rest):
+        option = option.strip()
+        if option[:1] == '"' and option[-1:] == '"' and len(option) > 1:
+            option = ESCAPE.sub(r'\1', option[1:-1])
+        options[name.lower()] = option
+    return main.strip().lower(), options
+
+
+def decode_component(raw, charset):
+    """Decode a percent-encoded urlencoded key or value."""
+    if b'+' in raw:
+        raw = raw.replace(b'+', b' ')
+    if b'%' in raw:
+        raw = unquote_to_bytes(raw)
+    return raw.decode(charset, 'replace')
+
+
+def parse_urlencoded(body, wants, charset='utf-8'):
+    """
+    Parse an application/x-www-form-urlencoded body.
+
+    Pairs are located by searching the body for separators, so that no pair
+    is copied unless its key is wanted.
+
+    Args:
+        body (bytes): the body.
+        wants (callable): takes a decoded key, and tells whether it is read.
+        charset (str): charset keys and values are encoded with.
+
+    Returns:
+        dict: maps each wanted key to its decoded value.
+    """
+
+    if not isinstance(body, (bytes, bytearray)):
+        body = bytes(body)
+
+    data = {}
+    start = 0
+    end = len(body)
+    while start < end:
+        stop = body.find(b'&', start)
+        if stop == -1:
+            stop = end
+        separator = body.find(b'=', start, stop)
+        if separator == -1:
+            separator = stop
+        if separator > start:
+            key = decode_component(body[start:separator], charset)
+            if key not in data and wants(key):
+                data[key] = decode_component(body[separator + 1:stop],
+                                             charset)
+        start = stop + 1
+    return data
+
+
+class MultipartReader(object):
+    """
+    Streaming multipart/form-data reader.
+
+    The body is read chunk by chunk. Apart from the values of the parts
+    being kept, no more than a chunk, plus a delimiter, is held in memory.
+    Part contents are handed over as memoryview slices of the read buffer,
+    which are only valid until the call they are passed to returns.
+
+    Args:
+        stream (file): file-like object the body is read from.
+        boundary (bytes): the multipart boundary.
+        wants (callable): takes a decoded part name, and tells whether it is
+                          read.
+        charset (str): charset part names and values are encoded with.
+        open_file (callable): when set, called with the name, filename and
+                              content type of every kept part, the filename
+                              being None for parts that aren't files. It
+                              returns a writable file-like object the part's
+                              content is written to, which becomes the part's
+                              value, and is rewound once the part was
+                              written, or None for the part to be read in
+                              memory. File parts read in memory are bytes.
+        chunk_size (int): number of bytes read at once.
+        max_header_size (int): maximum size of a part's headers.
+    """
+
+    def __init__(self, stream, boundary, wants, charset='utf-8',
+                 open_file=None, chunk_size=CHUNK_SIZE,
+                 max_header_size=MAX_HEADER_SIZE):
+        self.stream = stream
+        self.delimiter = b'\r\n--' + boundary
+        self.wants = wants
+        self.charset = charset
+        self.open_file = open_file
+        self.chunk_size = chunk_size
+        self.max_header_size = max_header_size
+        # the body's first boundary isn't preceded by a line break
+        self.buffer = bytearray(b'\r\n')
+
+    def fill(self):
+        """Read the next chunk into the buffer, returning False at EOF."""
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer.extend(chunk)
+        return True
+
+    def require(self, size):
+        """Make sure the buffer holds at least 'size' bytes."""
+        while len(self.buffer) < size:
+            if not self.fill():
+                raise MalformedBodyError('Unexpected end of multipart body.')
+
+    def transfer(self, write):
+        """
+        Consume the buffer up to, and including, the next delimiter.
+
+        Args:
+            write (callable): called with every consumed slice of content,
+                              or None for the content to be discarded.
+        """
+
+        buffer = self.buffer
+        delimiter = self.delimiter
+        # bytes that may be the beginning of a delimiter are kept around
+        keep = len(delimiter) - 1
+        while True:
+            index = buffer.find(delimiter)
+            if index != -1:
+                if write is not None and index:
+                    write(memoryview(buffer)[:index])
+                del buffer[:index + len(delimiter)]
+                return
+            safe = len(buffer) - keep
+            if safe > 0:
+                if write is not None:
+                    write(memoryview(buffer)[:safe])
+                del buffer[:safe]
+            if not self.fill():
+                raise MalformedBodyError('Unexpected end of multipart body.')
+
+    def read_headers(self):
+        """
+        Consume a part's headers.
+
+        Returns:
+            dict: maps lowercased header names to their values.
+        """
+
+        buffer = self.buffer
+        self.require(2)
+        if buffer.startswith(b'\r\n'):
+            del buffer[:2]
+            return {}
+        while True:
+            index = buffer.find(b'\r\n\r\n')
+            if index != -1:
+                break
+            if len(buffer) > self.max_header_size or not self.fill():
+                raise MalformedBodyError('Invalid multipart part headers.')
+        if index > self.max_header_size:
+            raise MalformedBodyError('Invalid multipart part headers.')
+
+        headers = {}
+        for line in bytes(buffer[:index]).split(b'\r\n'):
+            name, separator, value = line.decode(self.charset,
+                                                 'replace').partition(':')
+            if not separator:
+                raise MalformedBodyError('Invalid multipart part headers.')
+            headers[name.strip().lower()] = value.strip()
+        del buffer[:index + 4]
+        return headers
+
+    def read(self):
+        """
+        Read the whole body.
+
+        Returns:
+            dict: maps the name of each wanted part to its value: a string,
+                  bytes for file parts, or the object returned by
+                  'open_file'.
+
+        Raises:
+            MalformedBodyError: the body isn't valid multipart data.
+        """
+
+        data = {}
+        buffer = self.buffer
+        # skip the preamble
+        self.transfer(None)
+        while True:
+            self.require(2)
+            if buffer.startswith(b'--'):
+                return data
+            if not buffer.startswith(b'\r\n'):
+                raise MalformedBodyError('Invalid multipart boundary.')
+            del buffer[:2]
+
+            headers = self.read_headers()
+            _, disposition = parse_options_header(
+                headers.get('content-disposition', ''))
+            name = disposition.get('name')
+            if name is None or name in data or not self.wants(name):
+                self.transfer(None)
+                continue
+
+            filename = disposition.get('filename')
+            content_type, options = parse_options_header(
+                headers.get('content-type', 'text/plain'))
+            value = None
+            if self.open_file is not None:
+                value = self.open_file(name, filename, content_type)
+            if value is not None:
+                self.transfer(value.write)
+                value.seek(0)
+            else:
+                content = bytearray()
+                self.transfer(content.extend)
+                if filename is not None:
+                    value = bytes(content)
+                else:
+                    value = content.decode(
+                        options.get('charset', self.charset), 'replace')
+            data[name] = value
+
+
+def parse_body(schema, body, content_type):
+    """
+    Parse a raw request body into the data a Form reads.
+
+    Args:
+        schema (Schema): the Form's compiled Schema.
+        body (bytes): the body. Multipart bodies may also be file-like
+                      objects, which are then read chunk by chunk.
+        content_type (str): the request's Content-Type header.
+
+    Returns:
+        dict: maps each key read by the Form's fields to its value. Files,
+              and any part read by an UploadField, are
+              formscribe.upload.Upload objects, spooled to disk as the body
+              is read.
+
+    Raises:
+        MalformedBodyError: the body can't be parsed, or its content type
+                            isn't supported.
+    """
+
+    mimetype, options = parse_options_header(content_type or '')
+    charset = options.get('charset', 'utf-8')
+    if mimetype == URLENCODED:
+        if hasattr(body, 'read'):
+            body = body.read()
+        return parse_urlencoded(body, schema.wants, charset)
+    if mimetype == MULTIPART:
+        boundary = options.get('boundary')
+        if not boundary:
+            raise MalformedBodyError('Missing multipart boundary.')
+        if not hasattr(body, 'read'):
+            body = io.BytesIO(body)
+        # imported here, as formscribe.upload depends on formscribe itself
+        from formscribe.upload import open_upload
+
+        def open_file(name, filename, content_type):
+            return open_upload(schema, name, filename, content_type)
+
+        return MultipartReader(body, boundary.encode('latin-1'),
+                               schema.wants, charset, open_file).read()
+    raise MalformedBodyError('Unsupported content type: %s.' % mimetype)
@@ -0,0 +1,199 @@
+"""
+Generated field validation.
+
+A Form class may have its field validation loop compiled into a single,
+straight-line Python function, generated from its Schema. The function does
+exactly what Form.prepare_field() and Form.execute_field() do for each field
+in turn, with the validation plan unrolled, each field's 'when_value'
+comparisons and dependency checks spelled out, and the 'key' versus
+'regex_key' branch resolved once, when generating it.
+
+The generated function carries its source as a 'source' attribute, and its
+code is registered with the linecache module, so that tracebacks and
+debuggers show the generated lines.
+"""
+
+import linecache
+
+import six
+
+from formscribe.error import ValidationError
+from formscribe.result import ERROR
+from formscribe.result import SKIPPED_DEPENDENCY
+from formscribe.result import SKIPPED_DISABLED
+from formscribe.result import SKIPPED_VALUE
+from formscribe.result import VALIDATED
+
+
+class Writer(object):
+    """Accumulates indented source lines."""
+
+    def __init__(self):
+        self.lines = []
+        self.level = 0
+
+    def line(self, text):
+        self.lines.append('    ' * self.level + text)
+
+    def indent(self):
+        self.level += 1
+
+    def dedent(self):
+        self.level -= 1
+
+    def source(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+def has_plain_enabled(field):
+    """
+    Tell whether a field is always enabled, so that its 'enabled' attribute
+    needs no checking.
+
+    Fields defining their own __init__() might change 'enabled' on their
+    instances, so they are always checked.
+    """
+
+    from formscribe import Field
+
+    return field.enabled is True and field.__init__ is Field.__init__
+
+
+def write_field(writer, field, index, schema, namespace):
+    """Write the statements validating a single field."""
+
+    position = schema.positions[field]
+    name = 'F%d' % index
+    namespace[name] = field
+
+    writer.line('# %s' % field.__name__)
+    writer.line('instance = get_instance(%s)' % name)
+    plain_enabled = has_plain_enabled(field)
+    if not plain_enabled:
+        writer.line('try:')
+        writer.line('    enabled = instance.enabled()')
+        writer.line('except TypeError:')
+        writer.line('    enabled = instance.enabled')
+        writer.line('if not enabled:')
+        writer.line('    status[%d] = SKIPPED_DISABLED' % position)
+        writer.line('else:')
+        writer.indent()
+
+    writer.line('status[%d] = VALIDATED' % position)
+    if field.key:
+        writer.line('values[%s] = None' % name)
+
+    # skip conditions, in the order Form.prepare_field() checks them
+    conditions = []
+    for number, dependency in enumerate(schema.dependencies[field]):
+        if dependency.key in field.when_value:
+            expected = 'W%d_%d' % (index, number)
+            dependency_name = 'D%d_%d' % (index, number)
+            namespace[expected] = field.when_value[dependency.key]
+            namespace[dependency_name] = dependency
+            conditions.append((
+                '%s in values and %s != values[%s]' % (
+                    dependency_name, expected, dependency_name),
+                SKIPPED_VALUE))
+    for dependency_position in schema.dependency_positions[field]:
+        conditions.append(('status[%d] == ERROR' % dependency_position,
+                           SKIPPED_DEPENDENCY))
+
+    keyword = 'if'
+    for condition, outcome in conditions:
+        writer.line('%s %s:' % (keyword, condition))
+        writer.line('    status[%d] = %s' % (
+            position, 'SKIPPED_VALUE' if outcome == SKIPPED_VALUE
+            else 'SKIPPED_DEPENDENCY'))
+        keyword = 'elif'
+    if conditions:
+        writer.line('else:')
+        writer.indent()
+
+    if field.key:
+        key = 'K%d' % index
+        namespace[key] = field.key
+        writer.line('try:')
+        writer.line('    value = instance.validate(get(%s))' % key)
+        writer.line('except ValidationError as error:')
+        writer.line('    value = error')
+        writer.line('if isinstance(value, ValidationError):')
+        writer.line('    add_error(%s, value)' % name)
+        writer.line('    status[%d] = ERROR' % position)
+        writer.line('else:')
+        writer.line('    values[%s] = value' % name)
+    else:
+        group = 'G%d' % index
+        group_key = 'GK%d' % index
+        namespace[group] = field.regex_group
+        namespace[group_key] = field.regex_group_key
+        writer.line('group = regex_values[%s]' % group)
+        writer.line('count = len(errors)')
+        writer.line('for key, matches in get_routes(%s):' % name)
+        writer.line('    try:')
+        writer.line('        value = instance.validate(data[key])')
+        writer.line('    except ValidationError as error:')
+        writer.line('        value = error')
+        writer.line('    if isinstance(value, ValidationError):')
+        writer.line('        add_error(%s, value)' % name)
+        writer.line('    else:')
+        writer.line('        if matches not in group:')
+        writer.line('            group[matches] = {}')
+        writer.line('        group[matches][%s] = value' % group_key)
+        writer.line('if len(errors) > count:')
+        writer.line('    status[%d] = ERROR' % position)
+
+    if conditions:
+        writer.dedent()
+    if not plain_enabled:
+        writer.dedent()
+
+
+def compile_validator(form_class):
+    """
+    Generate the field validation function of a Form class.
+
+    Args:
+        form_class (type): Form class.
+
+    Returns:
+        function: takes a Form object, whose state was just reset, and
+                  validates all of its fields, dependencies first. Its
+                  source is available as its 'source' attribute.
+    """
+
+    schema = form_class.get_schema()
+    namespace = {
+        'ERROR': ERROR,
+        'SKIPPED_DEPENDENCY': SKIPPED_DEPENDENCY,
+        'SKIPPED_DISABLED': SKIPPED_DISABLED,
+        'SKIPPED_VALUE': SKIPPED_VALUE,
+        'VALIDATED': VALIDATED,
+        'ValidationError': ValidationError,
+    }
+
+    writer = Writer()
+    writer.line('def validate_fields(form):')
+    writer.indent()
+    writer.line('data = form.data')
+    writer.line('get = data.get')
+    writer.line('values = form.values')
+    writer.line('status = form.status')
+    writer.line('errors = form.errors')
+    writer.line('regex_values = form.regex_values')
+    writer.line('add_error = form.add_error')
+    writer.line('get_instance = form.get_field_instance')
+    writer.line('get_routes = form.get_regex_routes')
+    for index, field in enumerate(schema.plan):
+        write_field(writer, field, index, schema, namespace)
+    source = writer.source()
+
+    filename = '<formscribe validator %s.%s at %#x>' % (
+        form_class.__module__, form_class.__name__, id(form_class))
+    six.exec_(compile(source, filename, 'exec'), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True),
+                                 filename)
+
+    function = namespace['validate_fields']
+    function.source = source
+    return function
@@ -0,0 +1,250 @@
+"""
+Columnar validation of tabular batches.
+
+The checks added by formscribe.decorators are run column by column, over the
+whole batch at once, before any row is processed. Rows failing them are
+rejected right away, and only the remaining rows go through the regular,
+row by row, validation. It is given the values the checks returned, and
+only runs the Fields' own validate() methods, instead of the checks again.
+
+NumPy is optional. When it is installed, NumPy array columns whose dtype
+allows it are checked with array operations. Any other column is checked by
+calling the decorators' steps on each value.
+"""
+
+import numbers
+import types
+
+import six
+
+from formscribe.error import ValidationError
+from formscribe.result import Result
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ColumnarResult(object):
+    """
+    Outcome of a columnar batch.
+
+    Attributes:
+        mask (list): per-row booleans, True for rows rejected by the
+                     columnar checks. A NumPy array when NumPy is installed.
+        results (list): a Result per row. Results of rejected rows only hold
+                        the columnar checks' errors.
+    """
+
+    __slots__ = ('mask', 'results')
+
+    def __init__(self, mask, results):
+        self.mask = mask
+        self.results = results
+
+
+def get_checked_fields(schema):
+    """
+    Retrieve the fields whose decorator checks can run column by column.
+
+    Those are the key-based fields that are always validated: enabled by a
+    plain True attribute, with no dependencies, so that a failed check is
+    guaranteed to be reported by the regular validation as well.
+
+    Returns:
+        list: (field, steps) tuples, 'steps' being the field's pipeline.
+    """
+
+    checked = []
+    for field in schema.plan:
+        steps = getattr(field.validate, 'steps', None)
+        if (field.key and steps and field.enabled is True and
+                not schema.dependencies[field]):
+            checked.append((field, steps))
+    return checked
+
+
+def is_integral(array):
+    return array.dtype.kind in 'biu'
+
+
+def is_numeric(array):
+    return array.dtype.kind in 'biuf'
+
+
+def is_text(array):
+    return array.dtype.kind == 'U'
+
+
+def apply_step_vectorized(step, values):
+    """
+    Apply a check step to a whole NumPy column.
+
+    Returns:
+        tuple: (values, failed) arrays, or None when the step can't be
+               vectorized for this column's dtype.
+    """
+
+    kind = getattr(step, 'kind', None)
+    if step is bool:
+        if is_numeric(values):
+            return values.astype(bool), numpy.zeros(len(values), bool)
+        if is_text(values):
+            return (numpy.char.str_len(values) > 0,
+                    numpy.zeros(len(values), bool))
+    elif kind == 'integer':
+        if is_integral(values):
+            return values.astype(numpy.int64), numpy.zeros(len(values), bool)
+    elif kind == 'required':
+        if is_numeric(values):
+            return values, values == 0
+        if is_text(values):
+            return values, numpy.char.strip(values) == ''
+    elif kind == 'oneof':
+        members = step.members
+        numeric_members = all(isinstance(member, numbers.Number)
+                              for member in members)
+        text_members = all(isinstance(member, six.text_type)
+                           for member in members)
+        if (is_integral(values) and numeric_members) or \
+                (is_text(values) and text_members):
+            return values, ~numpy.isin(values, list(members))
+    return None
+
+
+def check_column(steps, values, size):
+    """
+    Run a field's check steps over a column.
+
+    Returns:
+        tuple: the list of per-row values returned by the last step, and the
+               list of per-row ValidationErrors of the first failed step, or
+               None.
+    """
+
+    errors = [None] * size
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        for index, step in enumerate(steps):
+            outcome = apply_step_vectorized(step, values)
+            if outcome is None:
+                # fall back to calling the remaining steps on each value
+                steps = steps[index:]
+                break
+            values, failed = outcome
+            for row in numpy.flatnonzero(failed):
+                if errors[row] is None:
+                    errors[row] = ValidationError(step.message)
+        else:
+            return values.tolist(), errors
+        values = values.tolist()
+
+    values = list(values)
+    for step in steps:
+        for row in range(size):
+            if errors[row] is None:
+                try:
+                    values[row] = step(values[row])
+                except ValidationError as error:
+                    errors[row] = error
+    return values, errors
+
+
+def get_prechecked_form(form_class, checked):
+    """
+    Derive a Form class whose prechecked fields skip their check steps.
+
+    Rows which passed the columnar checks already hold the values the steps
+    returned, so the instances of the prechecked fields only run the Fields'
+    own validate() methods. The derived class still uses the Form class'
+    own Field classes, so values are keyed, and fields observed, just like
+    for any other row. It is built once per Form class.
+
+    Args:
+        form_class (type): Form class.
+        checked (list): (field, steps) tuples, see get_checked_fields().
+    """
+
+    try:
+        return form_class.__dict__['_prechecked_form']
+    except KeyError:
+        pass
+
+    fields = frozenset(field for field, _ in checked)
+    base = form_class.get_field_instance
+
+    def get_field_instance(self, field):
+        instance = base(self, field)
+        if field in fields and 'validate' not in instance.__dict__:
+            instance.validate = types.MethodType(field.validate.method,
+                                                 instance)
+        return instance
+
+    attributes = {'__doc__': form_class.__doc__,
+                  '__module__': form_class.__module__,
+                  'get_field_instance': get_field_instance}
+    prechecked = type(form_class.__name__, (form_class,), attributes)
+    if hasattr(form_class, '__qualname__'):
+        prechecked.__qualname__ = form_class.__qualname__
+    form_class._prechecked_form = prechecked
+    return prechecked
+
+
+def validate_columns(form_class, columns, **kwargs):
+    """
+    Validate and submit a column-oriented batch against a Form class.
+
+    Args:
+        form_class (type): Form class.
+        columns (dict): maps data keys to sequences of values, such as lists
+                        or NumPy arrays, all of them having the same length.
+        **kwargs: attributes set on the Form object, just like the keyword
+                  arguments of Form.validate_many().
+
+    Returns:
+        ColumnarResult: the per-row rejection mask and results.
+
+    Raises:
+        ValueError: columns don't all have the same length.
+    """
+
+    sizes = set(len(column) for column in columns.values())
+    if len(sizes) > 1:
+        raise ValueError('Columns must all have the same length.')
+    size = sizes.pop() if sizes else 0
+
+    checked = get_checked_fields(form_class.get_schema())
+    lists = dict((key, column.tolist() if hasattr(column, 'tolist')
+                  else list(column)) for key, column in columns.items())
+    rejected = [[] for _ in range(size)]
+    for field, steps in checked:
+        try:
+            column = columns[field.key]
+        except KeyError:
+            column = [None] * size
+        values, errors = check_column(steps, column, size)
+        for row, error in enumerate(errors):
+            if error is not None:
+                rejected[row].append(error)
+        # accepted rows hold the values the steps returned
+        lists[field.key] = values
+
+    # only rows passing every columnar check are processed as usual, by
+    # fields which don't run the checks again
+    if checked:
+        form_class = get_prechecked_form(form_class, checked)
+    accepted = [row for row in range(size) if not rejected[row]]
+    rows = (dict((key, column[row]) for key, column in lists.items())
+            for row in accepted)
+    results = [None] * size
+    for row, result in zip(accepted, form_class.validate_many(rows,
+                                                              **kwargs)):
+        results[row] = result
+    for row in range(size):
+        if rejected[row]:
+            results[row] = Result({}, rejected[row], False)
+
+    mask = [bool(errors) for errors in rejected]
+    if numpy is not None:
+        mask = numpy.array(mask, dtype=bool)
+    return ColumnarResult(mask, results)
@@ -1,70 +1,172 @@
-from copy import copy
+"""
+Field decorators.
+
+Every decorator adds a check step to the decorated Field's validation
+pipeline. A Field decorated several times still has a single pipeline, which
+runs its steps in one flat loop, from the outermost decorator to the
+innermost one, before the Field's own validate() method. Each step receives
+the value returned by the previous one.
+
+Steps created by the built-in decorators carry a 'kind' attribute naming
+their decorator, along with their 'message', so that they can be recognised,
+e.g. by formscribe.columnar. The boolean() step is the bool type itself.
+"""
+
+import copy
 
 from formscribe.error import ValidationError
+from formscribe.util import LRUCache
+
+
+def add_step(cls, step):
+    """
+    Add a check step to a Field class' validation pipeline.
+
+    The pipeline is created by the first decorator applied to the class, and
+    wraps the validate() method the class had up to that point.
+
+    Args:
+        cls (type): Field class.
+        step (callable): takes a value and returns it, possibly converted, or
+                         raises ValidationError.
+    """
+
+    steps = getattr(cls.__dict__.get('validate'), 'steps', None)
+    if steps is None:
+        steps = []
+        method = cls.validate
+
+        def validate(self, value):
+            for check in steps:
+                value = check(value)
+            return method(self, value)
+
+        validate.steps = steps
+        validate.method = method
+        cls.validate = validate
+
+    # decorators are applied inside out, so the last one applied runs first
+    steps.insert(0, step)
+    return cls
 
 
 def integer(message):
-    def method_modifier(method):
-        def implementation(self, value):
-            try:
-                value = int(value)
-            except (ValueError, TypeError):
-                raise ValidationError(message)
-            else:
-                return method(self, value)
-        return implementation
+    def step(value):
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            raise ValidationError(message)
+
+    step.kind = 'integer'
+    step.message = message
 
     def class_modifier(cls):
-        cls.validate = method_modifier(cls.validate)
-        return cls
+        return add_step(cls, step)
 
     return class_modifier
 
 
 def oneof(group, message):
-    def method_modifier(method):
-        def implementation(self, value):
-            if value not in group:
-                raise ValidationError(message)
-            else:
-                return method(self, value)
-        return implementation
+    members = tuple(group)
+    try:
+        choices = frozenset(members)
+    except TypeError:
+        choices = members
+
+    def step(value):
+        try:
+            if value in choices:
+                return value
+        except TypeError:
+            # unhashable values can't be looked up in the frozenset
+            if value in members:
+                return value
+        raise ValidationError(message)
+
+    step.kind = 'oneof'
+    step.message = message
+    step.members = members
 
     def class_modifier(cls):
-        cls.validate = method_modifier(cls.validate)
-        return cls
+        return add_step(cls, step)
 
     return class_modifier
 
 
 def required(message):
-    def method_modifier(method):
-        def implementation(self, value):
-            nvalue = copy(value)
-            try:
-                nvalue = nvalue.strip()
-            except AttributeError:
-                pass
+    def step(value):
+        try:
+            stripped = value.strip()
+        except AttributeError:
+            stripped = value
 
-            if not nvalue:
-                raise ValidationError(message)
-            else:
-                return method(self, value)
-        return implementation
+        if not stripped:
+            raise ValidationError(message)
+        return value
+
+    step.kind = 'required'
+    step.message = message
 
     def class_modifier(cls):
-        cls.validate = method_modifier(cls.validate)
-        return cls
+        return add_step(cls, step)
 
     return class_modifier
 
 
 def boolean(cls):
-    def method_modifier(method):
-        def implementation(self, value):
-            value = bool(value)
-            return method(self, value)
-        return implementation
+    return add_step(cls, bool)
 
-    cls.validate = method_modifier(cls.validate)
-    return cls
+
+def memoize(maxsize=1024, ttl=None):
+    """
+    Cache a Field's validation results, for fields whose validation is a pure
+    function of the value.
+
+    Results are cached per Field class, keyed by value, in a bounded LRU
+    cache exposed as 'validate.cache'. ValidationErrors are cached as well,
+    as copies holding no traceback, and a copy of the cached error is
+    returned, rather than raised, on every hit, which Form supports. Values
+    which aren't hashable bypass the cache.
+
+    Apply it as the outermost decorator for the other decorators' checks to
+    be cached as well.
+
+    Args:
+        maxsize (int): maximum number of cached values.
+        ttl (float): when set, cached results expire after this many seconds.
+    """
+
+    def class_modifier(cls):
+        method = cls.validate
+        cache = LRUCache(maxsize, ttl)
+
+        def validate(self, value):
+            # the value's type is part of the key, as 1 == 1.0 == True
+            key = (value.__class__, value)
+            try:
+                found, result = cache.get(key)
+            except TypeError:
+                return method(self, value)
+            if not found:
+                try:
+                    result = method(self, value)
+                except ValidationError as error:
+                    result = error
+                if isinstance(result, ValidationError):
+                    # a copy is cached, as the error's traceback, and the
+                    # exceptions it is chained to, would keep the failing
+                    # Form alive
+                    cache.set(key, (True, copy.copy(result)))
+                else:
+                    cache.set(key, (False, result))
+                return result
+            failed, result = result
+            if failed:
+                return copy.copy(result)
+            return result
+
+        validate.cache = cache
+        cls.validate = validate
+        return cls
+
+    return class_modifier
@@ -1,3 +1,6 @@
+from six.moves import copyreg
+
+
 class InvalidFieldError(Exception):
     """
     Raised whenever a field has an invalid set of attributes.
@@ -10,6 +13,9 @@ class InvalidFieldError(Exception):
         super(InvalidFieldError, self).__init__()
         self.message = message
 
+    def __reduce__(self):
+        return (self.__class__, (self.message,))
+
 
 class ValidationError(Exception):
     """
@@ -24,6 +30,11 @@ class ValidationError(Exception):
         super(ValidationError, self).__init__()
         self.message = message
 
+    def __reduce__(self):
+        # errors are rebuilt from their attributes, without calling
+        # __init__(), which subclasses may give other arguments
+        return (copyreg.__newobj__, (self.__class__,), self.__dict__)
+
 
 class SubmitError(Exception):
     """
@@ -37,3 +48,30 @@ class SubmitError(Exception):
     def __init__(self, message):
         super(SubmitError, self).__init__()
         self.message = message
+
+    def __reduce__(self):
+        return (self.__class__, (self.message,))
+
+
+class LimitExceededError(ValidationError):
+    """
+    Raised whenever a payload exceeds one of the limits set on a Form, or on
+    one of its regex-based fields, e.g. because it holds too many keys.
+
+    Args:
+        message (str): the message describing the error.
+    """
+
+    pass
+
+
+class MalformedBodyError(ValidationError):
+    """
+    Raised whenever a raw request body can't be parsed, or has an unsupported
+    content type.
+
+    Args:
+        message (str): the message describing the error.
+    """
+
+    pass
@@ -0,0 +1,492 @@
+"""
+Typed fields.
+
+Typed fields are configured through class attributes, which are compiled
+into a coercer function whenever a typed Field class is created. Patterns
+are compiled, choices frozen and bounds checks specialised once, so that
+validating a value only runs the coercer, which returns the coerced value,
+or a ValidationError rather than raising it.
+
+Missing values, None or blank strings, are coerced to 'missing_value',
+unless the field is 'required'. Subclasses may override check() to further
+check values which were successfully coerced.
+"""
+
+import datetime
+import decimal
+import math
+import numbers
+import re
+
+import six
+
+from formscribe import Field
+from formscribe.error import ValidationError
+from formscribe.meta import MetaField
+
+try:
+    import enum
+except ImportError:
+    enum = None
+
+TRUE_STRINGS = frozenset(['1', 'true', 'on', 'yes', 'y', 't'])
+FALSE_STRINGS = frozenset(['0', 'false', 'off', 'no', 'n', 'f'])
+
+# ASCII digits only, as int() also accepts underscores and other scripts
+INTEGER = re.compile(r'[+-]?[0-9]+\Z')
+
+EMAIL_PATTERN = (
+    r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+"
+    r'@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+    r'(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+')
+
+
+class MetaTypedField(MetaField):
+    """
+    Typed Field metaclass.
+
+    Compiles a typed Field class' attributes into its 'coerce' function.
+    """
+
+    def __init__(cls, name, bases, attributes):
+        super(MetaTypedField, cls).__init__(name, bases, attributes)
+        cls.coerce = staticmethod(cls.compile_coercer())
+
+
+def check_bounds(convert, low, high, message):
+    """
+    Wrap a converter with a bounds check.
+
+    Only the bounds which are set are checked. Values which can't be
+    compared with the bounds, such as timezone-aware datetimes compared with
+    naive ones, are out of range.
+    """
+
+    if low is None and high is None:
+        return convert
+
+    def bounded(value):
+        value = convert(value)
+        if isinstance(value, ValidationError):
+            return value
+        try:
+            if (low is not None and value < low) or \
+                    (high is not None and value > high):
+                return ValidationError(message)
+        except TypeError:
+            return ValidationError(message)
+        return value
+
+    return bounded
+
+
+class TypedField(six.with_metaclass(MetaTypedField, Field)):
+    """
+    Base class of typed fields.
+
+    Typed fields hold no state of their own, so they are 'stateless'.
+
+    Attributes:
+        required (bool): whether missing values are rejected.
+        missing_value (object): value missing values are otherwise coerced
+                                to.
+        message (str): error message for values that can't be coerced.
+        required_message (str): error message for missing values.
+    """
+
+    message = 'Invalid value.'
+    missing_value = None
+    required = False
+    required_message = 'This field is required.'
+    stateless = True
+
+    @classmethod
+    def build_converter(cls):
+        """
+        Build the function converting present values.
+
+        Returns:
+            callable: takes a value, and returns its converted value, or a
+                      ValidationError.
+        """
+
+        return lambda value: value
+
+    @classmethod
+    def compile_coercer(cls):
+        """Compile the class' attributes into its coercer function."""
+        convert = cls.build_converter()
+        required = cls.required
+        required_message = cls.required_message
+        missing_value = cls.missing_value
+        string_types = six.string_types
+
+        def coerce(value):
+            if value is None or \
+                    (isinstance(value, string_types) and not value.strip()):
+                if required:
+                    return ValidationError(required_message)
+                return missing_value
+            return convert(value)
+
+        return coerce
+
+    def check(self, value):
+        """
+        Further check a coerced value.
+
+        Only called once a value was successfully coerced, so that overrides
+        never receive a ValidationError. Missing values are checked as well,
+        unless the field is 'required'.
+
+        Returns:
+            object: the value, which may be modified.
+
+        Raises:
+            ValidationError: the value is invalid.
+        """
+
+        return value
+
+    def validate(self, value):
+        value = self.coerce(value)
+        if isinstance(value, ValidationError):
+            return value
+        return self.check(value)
+
+
+class IntegerField(TypedField):
+    """
+    Integer field.
+
+    Strings must only hold ASCII digits, with an optional sign. Numbers must
+    be integral, booleans being rejected.
+
+    Attributes:
+        min_value (int): when set, smallest accepted value.
+        max_value (int): when set, largest accepted value.
+        range_message (str): error message for out of range values.
+    """
+
+    max_value = None
+    message = 'Enter a whole number.'
+    min_value = None
+    range_message = 'The number is out of range.'
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        string_types = six.string_types
+
+        def convert(value):
+            if value is True or value is False:
+                return ValidationError(message)
+            if isinstance(value, string_types):
+                value = value.strip()
+                if INTEGER.match(value) is None:
+                    return ValidationError(message)
+                return int(value)
+            if isinstance(value, numbers.Integral):
+                return int(value)
+            if isinstance(value, numbers.Number):
+                # floats, decimals and fractions are only accepted when
+                # they are integral
+                try:
+                    integer = int(value)
+                except (ValueError, TypeError, OverflowError):
+                    return ValidationError(message)
+                if integer == value:
+                    return integer
+            return ValidationError(message)
+
+        return check_bounds(convert, cls.min_value, cls.max_value,
+                            cls.range_message)
+
+
+class FloatField(TypedField):
+    """
+    Finite floating point number field.
+
+    Attributes:
+        min_value (float): when set, smallest accepted value.
+        max_value (float): when set, largest accepted value.
+        range_message (str): error message for out of range values.
+    """
+
+    max_value = None
+    message = 'Enter a number.'
+    min_value = None
+    range_message = 'The number is out of range.'
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        isfinite = getattr(math, 'isfinite', None) or \
+            (lambda number: not (math.isinf(number) or math.isnan(number)))
+
+        def convert(value):
+            try:
+                value = float(value)
+            except (ValueError, TypeError, OverflowError):
+                return ValidationError(message)
+            if not isfinite(value):
+                return ValidationError(message)
+            return value
+
+        return check_bounds(convert, cls.min_value, cls.max_value,
+                            cls.range_message)
+
+
+class DecimalField(TypedField):
+    """
+    Finite decimal number field.
+
+    Attributes:
+        places (int): when set, number of decimal places values are rounded
+                      to.
+        min_value (Decimal): when set, smallest accepted value.
+        max_value (Decimal): when set, largest accepted value.
+        range_message (str): error message for out of range values.
+    """
+
+    max_value = None
+    message = 'Enter a number.'
+    min_value = None
+    places = None
+    range_message = 'The number is out of range.'
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        exponent = None
+        if cls.places is not None:
+            exponent = decimal.Decimal(1).scaleb(-cls.places)
+        Decimal = decimal.Decimal
+        errors = (decimal.InvalidOperation, ValueError, TypeError)
+
+        def convert(value):
+            try:
+                if isinstance(value, float):
+                    value = repr(value)
+                elif isinstance(value, six.string_types):
+                    value = value.strip()
+                value = Decimal(value)
+                if not value.is_finite():
+                    return ValidationError(message)
+                if exponent is not None:
+                    value = value.quantize(exponent)
+            except errors:
+                return ValidationError(message)
+            return value
+
+        return check_bounds(convert, cls.min_value, cls.max_value,
+                            cls.range_message)
+
+
+class BooleanField(TypedField):
+    """
+    Boolean field.
+
+    Strings such as 'true', 'on', or '1', and 'false', 'off' or '0', are
+    accepted, regardless of their case. Missing values are coerced to False,
+    unless the field is 'required'.
+    """
+
+    message = 'Enter a boolean value.'
+    missing_value = False
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        string_types = six.string_types
+
+        def convert(value):
+            if value is True or value is False:
+                return value
+            if isinstance(value, string_types):
+                value = value.strip().lower()
+                if value in TRUE_STRINGS:
+                    return True
+                if value in FALSE_STRINGS:
+                    return False
+            elif value == 1 or value == 0:
+                return bool(value)
+            return ValidationError(message)
+
+        return convert
+
+
+class DateField(TypedField):
+    """
+    Date field.
+
+    Attributes:
+        format (str): strptime() format of the accepted strings. When None,
+                      ISO 8601 dates are accepted.
+        min_value (date): when set, earliest accepted date.
+        max_value (date): when set, latest accepted date.
+        range_message (str): error message for out of range dates.
+    """
+
+    format = None
+    max_value = None
+    message = 'Enter a valid date.'
+    min_value = None
+    range_message = 'The date is out of range.'
+
+    # the type values are coerced to
+    value_type = datetime.date
+    iso_format = '%Y-%m-%d'
+
+    @classmethod
+    def build_parser(cls):
+        """Build the function parsing strings, raising ValueError."""
+        if cls.format is None:
+            parser = getattr(cls.value_type, 'fromisoformat', None)
+            if parser is not None:
+                return parser
+        pattern = cls.format or cls.iso_format
+        strptime = datetime.datetime.strptime
+        if cls.value_type is datetime.date:
+            return lambda value: strptime(value, pattern).date()
+        return lambda value: strptime(value, pattern)
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        parse = cls.build_parser()
+        value_type = cls.value_type
+        string_types = six.string_types
+
+        def convert(value):
+            if isinstance(value, string_types):
+                try:
+                    return parse(value.strip())
+                except ValueError:
+                    return ValidationError(message)
+            # datetime is a date subclass, which a date field truncates
+            if value_type is datetime.date and \
+                    isinstance(value, datetime.datetime):
+                return value.date()
+            if isinstance(value, value_type):
+                return value
+            return ValidationError(message)
+
+        return check_bounds(convert, cls.min_value, cls.max_value,
+                            cls.range_message)
+
+
+class DateTimeField(DateField):
+    """
+    Date and time field.
+
+    See DateField, ISO 8601 date and times being accepted by default.
+    """
+
+    message = 'Enter a valid date and time.'
+
+    value_type = datetime.datetime
+    iso_format = '%Y-%m-%dT%H:%M:%S'
+
+
+class EnumField(TypedField):
+    """
+    Field accepting one of a set of choices.
+
+    Attributes:
+        choices (iterable): accepted values, or an enum.Enum subclass, in
+                            which case values are coerced to its members,
+                            looked up by value.
+    """
+
+    choices = ()
+    message = 'Select a valid choice.'
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        choices = cls.choices
+        if enum is not None and isinstance(choices, type) and \
+                issubclass(choices, enum.Enum):
+            members = dict((member.value, member) for member in choices)
+            members.update((member, member) for member in choices)
+
+            def convert(value):
+                try:
+                    return members[value]
+                except (KeyError, TypeError):
+                    return ValidationError(message)
+
+            return convert
+
+        members = frozenset(choices)
+
+        def convert(value):
+            try:
+                if value in members:
+                    return value
+            except TypeError:
+                pass
+            return ValidationError(message)
+
+        return convert
+
+
+class StringField(TypedField):
+    """
+    Bounded string field.
+
+    Attributes:
+        strip (bool): whether surrounding whitespace is removed.
+        min_length (int): when set, minimum length.
+        max_length (int): when set, maximum length.
+        pattern (str): when set, regular expression the whole string must
+                       match.
+        length_message (str): error message for strings of invalid length.
+    """
+
+    length_message = 'The text has an invalid length.'
+    max_length = None
+    message = 'Enter valid text.'
+    min_length = None
+    pattern = None
+    strip = True
+
+    @classmethod
+    def build_matcher(cls):
+        """Build the function telling whether a string is valid."""
+        if cls.pattern is None:
+            return None
+        return re.compile('(?:%s)\\Z' % cls.pattern).match
+
+    @classmethod
+    def build_converter(cls):
+        message = cls.message
+        length_message = cls.length_message
+        strip = cls.strip
+        match = cls.build_matcher()
+        string_types = six.string_types
+        low = cls.min_length or 0
+        high = cls.max_length
+
+        def convert(value):
+            if not isinstance(value, string_types):
+                return ValidationError(message)
+            if strip:
+                value = value.strip()
+            length = len(value)
+            if length < low or (high is not None and length > high):
+                return ValidationError(length_message)
+            if match is not None and match(value) is None:
+                return ValidationError(message)
+            return value
+
+        return convert
+
+
+class EmailField(StringField):
+    """E-mail address field, at most 254 characters long."""
+
+    max_length = 254
+    message = 'Enter a valid e-mail address.'
+    pattern = EMAIL_PATTERN
@@ -0,0 +1,119 @@
+"""
+Field-level instrumentation.
+
+An observer may be installed on a Form, through its 'observer' attribute, to
+be notified of every field processed by the validation loop. When no observer
+is installed, the validation loop doesn't measure anything.
+"""
+
+import bisect
+import threading
+
+from formscribe.result import ERROR
+from formscribe.result import SKIPPED_DEPENDENCY
+from formscribe.result import SKIPPED_DISABLED
+from formscribe.result import SKIPPED_VALUE
+from formscribe.result import STATUS_NAMES
+from formscribe.result import VALIDATED
+
+# outcomes of a field's validation
+OUTCOMES = (VALIDATED, ERROR, SKIPPED_DISABLED, SKIPPED_VALUE,
+            SKIPPED_DEPENDENCY)
+
+
+class Observer(object):
+    """
+    Base class for Form observers.
+
+    Override field_finished() to be notified of every processed field.
+    """
+
+    def field_finished(self, form, field, outcome, started, finished,
+                       matches):
+        """
+        Called whenever the validation loop is done with a field.
+
+        Args:
+            form (Form): the Form object being processed.
+            field (type): the Field class.
+            outcome (int): one of VALIDATED, ERROR, SKIPPED_DISABLED,
+                           SKIPPED_VALUE (a 'when_value' condition wasn't
+                           met) or SKIPPED_DEPENDENCY (a dependency is
+                           invalid).
+            started (float): timeit.default_timer() value before the field
+                             was processed.
+            finished (float): timeit.default_timer() value after the field
+                              was processed.
+            matches (int): number of data keys matched by a regex field, or
+                           0 for key-based fields.
+        """
+
+        pass
+
+
+class HistogramObserver(Observer):
+    """
+    Observer aggregating per-field counters and duration histograms.
+
+    It is thread-safe, so a single instance may be shared by every Form
+    object of an application.
+
+    Args:
+        buckets (tuple): upper bounds of the duration histogram buckets, in
+                         seconds. Durations above the last bound are counted
+                         in an extra, unbounded bucket.
+    """
+
+    BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.fields = {}
+
+    def field_finished(self, form, field, outcome, started, finished,
+                       matches):
+        duration = finished - started
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self.lock:
+            try:
+                stats = self.fields[field]
+            except KeyError:
+                stats = self.fields[field] = {
+                    'outcomes': dict((name, 0) for name in OUTCOMES),
+                    'histogram': [0] * (len(self.buckets) + 1),
+                    'total_time': 0.0,
+                    'matches': 0,
+                }
+            stats['outcomes'][outcome] += 1
+            stats['histogram'][bucket] += 1
+            stats['total_time'] += duration
+            stats['matches'] += matches
+
+    def export(self):
+        """
+        Export the aggregated statistics.
+
+        Returns:
+            dict: maps each field's qualified name to a dict holding its
+                  'outcomes' counters, keyed by outcome name, its duration
+                  'histogram' as (upper bound, count) tuples, the upper bound
+                  of the last bucket being None, its 'total_time' and its
+                  regex 'matches' count.
+        """
+
+        bounds = self.buckets + (None,)
+        with self.lock:
+            return dict((getattr(field, '__qualname__', field.__name__), {
+                'outcomes': dict((STATUS_NAMES[outcome], count)
+                                 for outcome, count
+                                 in stats['outcomes'].items()),
+                'histogram': list(zip(bounds, stats['histogram'])),
+                'total_time': stats['total_time'],
+                'matches': stats['matches'],
+            }) for field, stats in self.fields.items())
+
+    def reset(self):
+        """Discard every aggregated statistic."""
+        with self.lock:
+            self.fields = {}
@@ -5,26 +5,44 @@ from formscribe.error import InvalidFieldError
 
 
 class MetaField(type):
-    """Field metaclass."""
+    """
+    Field metaclass.
 
-    def __call__(cls, *args, **kwargs):
-        instance = object.__new__(cls, *args, **kwargs)
+    A Field class' attributes are checked once, when the class is created.
+    Any inconsistency is reported by raising an InvalidFieldError whenever
+    the class is instantiated, or used by a Form.
+    """
+
+    def __init__(cls, name, bases, attributes):
+        super(MetaField, cls).__init__(name, bases, attributes)
+        cls._attribute_error = MetaField.check_attributes(cls)
 
-        regex_attributes = [getattr(instance, attribute) for attribute in
+    def check_attributes(cls):
+        """
+        Check whether a Field class' attributes are consistent.
+
+        Returns:
+            str: message describing the inconsistency, or None.
+        """
+
+        regex_attributes = [getattr(cls, attribute) for attribute in
                             ('regex_group', 'regex_group_key', 'regex_key')]
         if any(regex_attributes) and not all(regex_attributes):
-            raise InvalidFieldError('The following attributes are required:'
-                                    ' regex_group, regex_group_key,'
-                                    ' regex_key.')
+            return ('The following attributes are required:'
+                    ' regex_group, regex_group_key, regex_key.')
 
-        if instance.regex_key and instance.key:
-            raise InvalidFieldError('The following attributes are incompatible:'
-                                    ' regex_key, key.')
+        if cls.regex_key and cls.key:
+            return ('The following attributes are incompatible:'
+                    ' regex_key, key.')
 
-        if not instance.key and not all(regex_attributes):
-            raise InvalidFieldError('Field must be either key-based or'
-                                    ' regex-based.')
+        if not cls.key and not all(regex_attributes):
+            return 'Field must be either key-based or regex-based.'
 
+    def __call__(cls, *args, **kwargs):
+        if cls._attribute_error:
+            raise InvalidFieldError(cls._attribute_error)
+
+        instance = object.__new__(cls, *args, **kwargs)
         instance.__init__()
 
         try:
@@ -45,3 +63,11 @@ class MetaField(type):
                     pass
 
         return instance
+
+
+class MetaForm(type):
+    """Form metaclass."""
+
+    def __init__(cls, name, bases, attributes):
+        super(MetaForm, cls).__init__(name, bases, attributes)
+        cls._schema = cls.compile_schema()
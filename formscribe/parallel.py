@@ -0,0 +1,113 @@
+"""Parallel validation over a pool of worker processes."""
+
+import importlib
+from multiprocessing import Pool
+
+from formscribe.util import chunked
+
+# Form class and keyword arguments used by the current worker process
+worker_form = None
+worker_kwargs = {}
+
+
+def get_import_path(form_class):
+    """
+    Retrieve the path Form classes are shipped to worker processes by.
+
+    Returns:
+        str: 'module:QualifiedName' path of the Form class.
+
+    Raises:
+        ValueError: the Form class can't be imported by its path, e.g.
+                    because it was defined inside a function.
+    """
+
+    name = getattr(form_class, '__qualname__', form_class.__name__)
+    path = '%s:%s' % (form_class.__module__, name)
+    try:
+        imported = import_form(path)
+    except (AttributeError, ImportError):
+        imported = None
+    if imported is not form_class:
+        raise ValueError('%s can\'t be imported from its module.' % name)
+    return path
+
+
+def import_form(path):
+    """Import a Form class from a 'module:QualifiedName' path."""
+    module, name = path.split(':')
+    obj = importlib.import_module(module)
+    for attribute in name.split('.'):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def initialize_worker(path, kwargs):
+    global worker_form, worker_kwargs
+    worker_form = import_form(path)
+    worker_kwargs = kwargs
+
+
+def validate_chunk(chunk):
+    start, rows = chunk
+    return start, list(worker_form.validate_many(rows, **worker_kwargs))
+
+
+def validate_parallel(form_class, rows, processes=None, chunk_size=100,
+                      ordered=True, **kwargs):
+    """
+    Validate and submit many payloads over a pool of worker processes.
+
+    The Form class is shipped to the workers by its import path, and rows
+    are sent to them in chunks. The pool is only started once results are
+    consumed, but the Form class is checked right away.
+
+    Args:
+        form_class (type): Form class, which must be importable from its
+                           module.
+        rows (iterable): dict-like objects, each one being processed by
+                         Form.validate_many().
+        processes (int): number of worker processes, defaulting to the number
+                         of CPUs.
+        chunk_size (int): number of rows sent to a worker at once.
+        ordered (bool): whether results should be yielded in the same order
+                        as their rows. When False, results are yielded as soon
+                        as they are ready, along with their row's index.
+        **kwargs: attributes set on each worker's Form object. They must be
+                  picklable.
+
+    Returns:
+        generator: yields Result objects, or (index, Result) tuples when
+                   'ordered' is False.
+
+    Raises:
+        ValueError: the Form class can't be imported from its module.
+    """
+
+    path = get_import_path(form_class)
+    return run_pool(path, rows, processes, chunk_size, ordered, kwargs)
+
+
+def run_pool(path, rows, processes, chunk_size, ordered, kwargs):
+    """
+    Run the worker pool of validate_parallel(), shutting it down once every
+    result was yielded, or the generator is closed.
+    """
+
+    pool = Pool(processes, initializer=initialize_worker,
+                initargs=(path, kwargs))
+    try:
+        chunks = ((index * chunk_size, chunk) for index, chunk
+                  in enumerate(chunked(rows, chunk_size)))
+        if ordered:
+            for _, results in pool.imap(validate_chunk, chunks):
+                for result in results:
+                    yield result
+        else:
+            for start, results in pool.imap_unordered(validate_chunk, chunks):
+                for offset, result in enumerate(results):
+                    yield start + offset, result
+        pool.close()
+        pool.join()
+    finally:
+        pool.terminate()
@@ -0,0 +1,49 @@
+"""Form processing results."""
+
+# status of a field, as recorded by a Form, indexed by its position in the
+# Form's Schema.fields
+NOT_EVALUATED = 0
+VALIDATED = 1
+ERROR = 2
+SKIPPED_DISABLED = 3
+SKIPPED_VALUE = 4
+SKIPPED_DEPENDENCY = 5
+
+STATUS_NAMES = {
+    NOT_EVALUATED: 'not-evaluated',
+    VALIDATED: 'validated',
+    ERROR: 'error',
+    SKIPPED_DISABLED: 'skipped-disabled',
+    SKIPPED_VALUE: 'skipped-value',
+    SKIPPED_DEPENDENCY: 'skipped-dependency',
+}
+
+
+class Result(object):
+    """
+    Compact outcome of a processed payload.
+
+    Attributes:
+        values (dict): validated values, as passed on to Form.validate() and
+                       Form.submit().
+        errors (list): ValidationError and SubmitError objects.
+        submitted (bool): whether the payload was successfully submitted.
+        status (bytes): status code of each field, indexed by its position
+                        in the Form's Schema.fields.
+    """
+
+    __slots__ = ('values', 'errors', 'submitted', 'status')
+
+    def __init__(self, values, errors, submitted, status=b''):
+        self.values = values
+        self.errors = errors
+        self.submitted = submitted
+        self.status = status
+
+    def __reduce__(self):
+        return (Result, (self.values, self.errors, self.submitted,
+                         self.status))
+
+    def __repr__(self):
+        return 'Result(values=%r, errors=%r, submitted=%r)' % (
+            self.values, self.errors, self.submitted)
@@ -0,0 +1,347 @@
+"""Compiled Form schemas."""
+
+import os
+import re
+import threading
+from multiprocessing.pool import ThreadPool
+
+from formscribe.error import InvalidFieldError
+from formscribe.error import LimitExceededError
+from formscribe.meta import MetaField
+from formscribe.util import get_attributes
+from formscribe.util import get_parameters
+from formscribe.util import is_overridden
+
+
+class Schema(object):
+    """
+    Compiled description of a Form class' fields.
+
+    A Schema is built once per Form subclass, when the class is created,
+    and is then shared by every instance of that class.
+
+    Attributes:
+        fields (list): Field classes declared on the Form, in attribute name
+                       order.
+        positions (dict): maps each Field class to its index in 'fields'.
+        key_index (dict): maps each 'key' to its key-based Field class.
+        key_fields (dict): maps each 'key' to the list of every key-based
+                           Field class using it.
+        dependencies (dict): maps each Field class to the list of Field
+                             classes it depends on, through 'when_validated'
+                             and 'when_value'.
+        dependency_positions (dict): maps each Field class to the positions
+                                     of its dependencies.
+        dependents (dict): maps each Field class to the list of Field
+                           classes directly depending on it.
+        plan (list): Field classes in topological order, each field coming
+                     after all of its dependencies.
+        regex_fields (list): regex-based Field classes, in field order.
+        regex_groups (list): distinct regex groups, in field order.
+        group_fields (dict): maps each regex group to its Field classes.
+        dispatcher (RegexDispatcher): routes data keys to regex fields.
+        field_instances (dict): instances of stateless Field classes, shared
+                                by every Form object.
+        argument_names (dict): maps each key-based Field class to the name of
+                               its keyword argument, its lowercased class
+                               name.
+        validates (bool): whether the Form class implements validate().
+        submits (bool): whether the Form class implements submit().
+        validate_parameters (frozenset): keyword arguments validate()
+                                         accepts, or None for any.
+        submit_parameters (frozenset): keyword arguments submit() accepts,
+                                       or None for any.
+        parameters (frozenset): keyword arguments accepted by either of the
+                                implemented methods, or None for any.
+        submit_pools (dict): thread pools fields are concurrently submitted
+                             over, see get_submit_pool().
+
+    Raises:
+        InvalidFieldError: a field has an invalid set of attributes, depends
+                           on a key no field provides, or the fields'
+                           dependencies form a cycle.
+    """
+
+    def __init__(self, form_class):
+        self.fields = [attribute for attribute in get_attributes(form_class)
+                       if isinstance(attribute, MetaField)]
+        for field in self.fields:
+            if field._attribute_error:
+                raise InvalidFieldError('%s: %s' % (field.__name__,
+                                                    field._attribute_error))
+
+        self.positions = dict((field, position) for position, field
+                              in enumerate(self.fields))
+
+        self.key_index = {}
+        self.key_fields = {}
+        for field in self.fields:
+            if field.key:
+                self.key_index.setdefault(field.key, field)
+                self.key_fields.setdefault(field.key, []).append(field)
+
+        self.dependencies = {}
+        for field in self.fields:
+            dependencies_keys = set(field.when_validated +
+                                    list(field.when_value.keys()))
+            for key in sorted(dependencies_keys):
+                if key not in self.key_index:
+                    raise InvalidFieldError('%s depends on unknown key: %s.'
+                                            % (field.__name__, key))
+            self.dependencies[field] = [
+                dependency for dependency in self.fields
+                if dependency.key in dependencies_keys]
+
+        self.dependency_positions = dict(
+            (field, [self.positions[dependency] for dependency in dependencies])
+            for field, dependencies in self.dependencies.items())
+
+        self.dependents = dict((field, []) for field in self.fields)
+        for field in self.fields:
+            for dependency in self.dependencies[field]:
+                self.dependents[dependency].append(field)
+
+        self.plan = self.sort_fields()
+
+        self.regex_fields = [field for field in self.fields
+                             if field.regex_key]
+        self.regex_groups = []
+        self.group_fields = {}
+        for field in self.regex_fields:
+            if field.regex_group not in self.regex_groups:
+                self.regex_groups.append(field.regex_group)
+            self.group_fields.setdefault(field.regex_group, []).append(field)
+        self.dispatcher = RegexDispatcher(self.regex_fields)
+        self.field_instances = {}
+
+        self.argument_names = dict((field, field.__name__.lower())
+                                   for field in self.fields if field.key)
+        self.validates = is_overridden(form_class, 'validate')
+        self.submits = is_overridden(form_class, 'submit')
+        self.validate_parameters = get_parameters(form_class.validate)
+        self.submit_parameters = get_parameters(form_class.submit)
+        implemented = [parameters for parameters, implements
+                       in ((self.validate_parameters, self.validates),
+                           (self.submit_parameters, self.submits))
+                       if implements]
+        if None in implemented:
+            self.parameters = None
+        else:
+            self.parameters = frozenset().union(*implemented)
+        self.submit_pools = {}
+        self.submit_lock = threading.Lock()
+
+    def get_submit_pool(self, workers):
+        """
+        Retrieve the thread pool fields are concurrently submitted over.
+
+        A pool is created on first use for every number of workers, and is
+        then shared by every payload and Form object, instead of threads
+        being started for each payload. Pools are created again in forked
+        processes, which don't inherit their threads.
+
+        Args:
+            workers (int): number of threads.
+
+        Returns:
+            ThreadPool: the pool.
+        """
+
+        key = (os.getpid(), workers)
+        try:
+            return self.submit_pools[key]
+        except KeyError:
+            pass
+        with self.submit_lock:
+            pool = self.submit_pools.get(key)
+            if pool is None:
+                pool = self.submit_pools[key] = ThreadPool(workers)
+            return pool
+
+    def wants(self, key):
+        """Tell whether any field, key-based or regex-based, reads a key."""
+        return key in self.key_index or self.dispatcher.matches(key)
+
+    def sort_fields(self):
+        """
+        Sort fields topologically, so that every field comes after its
+        dependencies.
+
+        Fields are otherwise kept in attribute name order, which matches the
+        order in which a depth-first validation would visit them.
+
+        Raises:
+            InvalidFieldError: the dependencies form a cycle.
+        """
+
+        plan = []
+        visited = set()
+        for root in self.fields:
+            if root in visited:
+                continue
+            # iterative depth-first search, so that long dependency chains
+            # can't exhaust the interpreter's stack
+            path = [root]
+            stack = [iter(self.dependencies[root])]
+            while stack:
+                for dependency in stack[-1]:
+                    if dependency in visited:
+                        continue
+                    if dependency in path:
+                        cycle = path[path.index(dependency):] + [dependency]
+                        raise InvalidFieldError(
+                            'Circular dependency: %s.' %
+                            ' -> '.join(field.__name__ for field in cycle))
+                    path.append(dependency)
+                    stack.append(iter(self.dependencies[dependency]))
+                    break
+                else:
+                    stack.pop()
+                    field = path.pop()
+                    visited.add(field)
+                    plan.append(field)
+        return plan
+
+
+REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def literal_prefix(pattern):
+    """
+    Retrieve the literal text every match of a regular expression starts with.
+
+    Only a conservative, possibly empty, prefix is returned: any string the
+    pattern can be found in is guaranteed to contain it.
+
+    Args:
+        pattern (str): the regular expression.
+    """
+
+    if '|' in pattern:
+        return ''
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    prefix = []
+    for char in pattern:
+        if char in REGEX_METACHARACTERS:
+            # the last literal character may be optional
+            if char in '*?{' and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return ''.join(prefix)
+
+
+class RegexDispatcher(object):
+    """
+    Routes data keys to the regex-based fields they match, in a single pass.
+
+    Every 'regex_key' is compiled once. When possible, all of them are also
+    combined into a single alternation, which rejects keys no regex field can
+    match with one search. Keys that get through are then only tried against
+    the fields whose literal prefix they contain.
+
+    Args:
+        fields (list): regex-based Field classes.
+
+    Attributes:
+        limited (bool): whether any of the fields sets 'max_matches'.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.entries = [(field, re.compile(field.regex_key),
+                         literal_prefix(field.regex_key))
+                        for field in fields]
+        self.combined = self.combine([field.regex_key for field in fields])
+        self.limited = any(field.max_matches is not None for field in fields)
+
+    @staticmethod
+    def combine(patterns):
+        """
+        Compile a set of patterns into one alternation with named groups.
+
+        Returns None when there is nothing to combine, or when the patterns
+        can't be safely combined, e.g. because they use backreferences,
+        whose numbering would be shifted by the alternation.
+        """
+
+        if len(patterns) < 2:
+            return None
+        for pattern in patterns:
+            if re.search(r'\\\d|\(\?P=', pattern):
+                return None
+        try:
+            return re.compile('|'.join('(?P<_%d>%s)' % (index, pattern)
+                                       for index, pattern
+                                       in enumerate(patterns)))
+        except re.error:
+            return None
+
+    def matches(self, key):
+        """Tell whether any regex field matches a key."""
+        if self.combined is not None:
+            return self.combined.search(key) is not None
+        for _, pattern, prefix in self.entries:
+            if (not prefix or prefix in key) and pattern.search(key):
+                return True
+        return False
+
+    def dispatch(self, keys, max_keys=None, max_groups=None):
+        """
+        Match keys against every regex field.
+
+        Limits are enforced while scanning, so that the scan stops as soon as
+        one of them is exceeded, whatever the number of keys left.
+
+        Args:
+            keys (iterable): data keys, in the order they should be routed.
+            max_keys (int): when set, maximum number of keys.
+            max_groups (int): when set, maximum number of distinct regex
+                              group entries, over every regex group.
+
+        Returns:
+            dict: maps each regex field to a list of (key, matches) tuples,
+                  'matches' being the tuple of every match of the field's
+                  'regex_key' in 'key'.
+
+        Raises:
+            LimitExceededError: 'max_keys', 'max_groups', or the
+                                'max_matches' attribute of a field, was
+                                exceeded.
+        """
+
+        routes = dict((field, []) for field in self.fields)
+        if not self.fields and max_keys is None:
+            return routes
+        search = self.combined.search if self.combined else None
+        entries = self.entries
+        limited = self.limited
+        groups = set() if max_groups is not None else None
+        for count, key in enumerate(keys, 1):
+            if max_keys is not None and count > max_keys:
+                raise LimitExceededError(
+                    'The payload holds more than %d keys.' % max_keys)
+            if search is not None and search(key) is None:
+                continue
+            for field, pattern, prefix in entries:
+                if prefix and prefix not in key:
+                    continue
+                matches = pattern.findall(key)
+                if not matches:
+                    continue
+                matches = tuple(matches)
+                field_routes = routes[field]
+                field_routes.append((key, matches))
+                if limited and field.max_matches is not None and \
+                        len(field_routes) > field.max_matches:
+                    raise LimitExceededError(
+                        'The payload holds more than %d %s keys.' %
+                        (field.max_matches, field.__name__))
+                if groups is not None:
+                    groups.add((field.regex_group, matches))
+                    if len(groups) > max_groups:
+                        raise LimitExceededError(
+                            'The payload holds more than %d regex group'
+                            ' entries.' % max_groups)
+        return routes
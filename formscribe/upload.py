@@ -0,0 +1,218 @@
+"""
+File uploads.
+
+Files sent through multipart bodies, see Form.from_body(), are spooled to a
+temporary file as they are read, instead of being held in memory. Their
+size, leading bytes and hash are computed in the same single pass, so that
+UploadField can check them without reading the file again.
+"""
+
+import hashlib
+import mmap
+import tempfile
+
+from formscribe import Field
+from formscribe.error import ValidationError
+
+# number of leading bytes kept for type sniffing
+HEAD_SIZE = 64
+
+# size above which spooled uploads are moved from memory to disk
+SPOOL_SIZE = 1024 * 1024
+
+
+class Upload(object):
+    """
+    Uploaded file, spooled to a temporary file as it is written.
+
+    The temporary file lives in memory until it grows larger than
+    'spool_size', and is deleted once the Upload is closed, or garbage
+    collected.
+
+    Args:
+        filename (str): filename sent by the client.
+        content_type (str): content type sent by the client.
+        max_size (int): when set, content written past this many bytes is
+                        discarded, and 'exceeded' is set.
+        hash_algorithm (str): when set, name of the hashlib algorithm the
+                              content is hashed with.
+        head_size (int): number of leading bytes kept in 'head'.
+        spool_size (int): size above which the content is moved to disk.
+
+    Attributes:
+        size (int): number of bytes written, including discarded ones.
+        head (bytes): leading bytes of the content.
+        exceeded (bool): whether 'max_size' was exceeded.
+    """
+
+    def __init__(self, filename=None, content_type=None, max_size=None,
+                 hash_algorithm=None, head_size=HEAD_SIZE,
+                 spool_size=SPOOL_SIZE):
+        self.filename = filename
+        self.content_type = content_type
+        self.max_size = max_size
+        self.hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self.head_size = head_size
+        self.file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        self.size = 0
+        self.head = b''
+        self.exceeded = False
+
+    def write(self, data):
+        """
+        Append content, e.g. a slice of a multipart body.
+
+        Args:
+            data (bytes): bytes-like object, such as a memoryview, which
+                          isn't referenced once this method returns.
+        """
+
+        self.size += len(data)
+        if self.exceeded:
+            return
+        if self.max_size is not None and self.size > self.max_size:
+            # nothing past the limit is stored or hashed
+            self.exceeded = True
+            return
+        if len(self.head) < self.head_size:
+            self.head += bytes(data[:self.head_size - len(self.head)])
+        if self.hasher is not None:
+            self.hasher.update(data)
+        self.file.write(data)
+
+    @property
+    def digest(self):
+        """Hexadecimal digest of the content, or None when not hashed."""
+        if self.hasher is None:
+            return None
+        return self.hasher.hexdigest()
+
+    def read(self, size=-1):
+        return self.file.read(size)
+
+    def seek(self, offset, whence=0):
+        return self.file.seek(offset, whence)
+
+    def tell(self):
+        return self.file.tell()
+
+    def chunks(self, size=SPOOL_SIZE):
+        """Lazily read the content, from the current position, by chunks."""
+        while True:
+            chunk = self.file.read(size)
+            if not chunk:
+                return
+            yield chunk
+
+    def mmap(self):
+        """
+        Map the content in memory, moving it to disk first if needed.
+
+        Returns:
+            mmap.mmap: read-only memory map of the content.
+
+        Raises:
+            ValueError: the content is empty, and can't be mapped.
+        """
+
+        self.file.rollover()
+        return mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        """Close, and delete, the temporary file."""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class UploadField(Field):
+    """
+    Represents a file field of a multipart form.
+
+    Its validate() and submit() methods receive Upload objects, which were
+    already checked against the attributes below. Subclasses overriding
+    validate() should call this implementation first.
+
+    Attributes:
+        max_size (int): maximum size of the file, in bytes.
+        signatures (tuple): when not empty, leading bytes the file must start
+                            with one of, e.g. (b'\\x89PNG', b'\\xff\\xd8\\xff').
+        hash_algorithm (str): when set, the hashlib algorithm the file is
+                              hashed with, see Upload.digest.
+        spool_size (int): size above which the file is moved to disk.
+        invalid_message (str): error message for values that aren't files.
+        size_message (str): error message for files exceeding 'max_size'.
+        type_message (str): error message for files matching no signature.
+    """
+
+    hash_algorithm = None
+    invalid_message = 'A file is expected.'
+    max_size = None
+    signatures = ()
+    size_message = 'The file is too large.'
+    spool_size = SPOOL_SIZE
+    type_message = 'The file type is not allowed.'
+
+    @classmethod
+    def open_upload(cls, filename, content_type):
+        """Create the Upload a file sent for this field is written to."""
+        head_size = max([HEAD_SIZE] + [len(signature)
+                                       for signature in cls.signatures])
+        return Upload(filename, content_type, max_size=cls.max_size,
+                      hash_algorithm=cls.hash_algorithm, head_size=head_size,
+                      spool_size=cls.spool_size)
+
+    def validate(self, upload):
+        """
+        Check an Upload against this field's limits.
+
+        Returns:
+            Upload: the upload, or None when no file was sent.
+
+        Raises:
+            ValidationError: the value isn't a file, or the file is too
+                             large, or doesn't match any signature.
+        """
+
+        if upload is None:
+            return None
+        if not isinstance(upload, Upload):
+            raise ValidationError(self.invalid_message)
+        if upload.exceeded:
+            raise ValidationError(self.size_message)
+        if self.signatures and \
+                not upload.head.startswith(tuple(self.signatures)):
+            raise ValidationError(self.type_message)
+        return upload
+
+
+def open_upload(schema, name, filename, content_type):
+    """
+    Create the Upload a part of a multipart body is written to.
+
+    Parts sent for an UploadField are configured by it, whether or not they
+    have a filename, so that their size is bounded before they reach the
+    field. Any other file is spooled with the default settings.
+
+    Returns:
+        Upload: the Upload, or None for parts that aren't files, nor sent for
+                an UploadField, which are then read in memory.
+    """
+
+    field = schema.key_index.get(name)
+    if field is None:
+        routes = schema.dispatcher.dispatch([name])
+        for candidate in schema.regex_fields:
+            if routes[candidate]:
+                field = candidate
+                break
+    opener = getattr(field, 'open_upload', None)
+    if opener is None:
+        if filename is None:
+            return None
+        return Upload(filename, content_type)
+    return opener(filename, content_type)
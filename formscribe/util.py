@@ -1,6 +1,199 @@
 """General utilities."""
 
+import inspect
+import threading
+from itertools import islice
+from timeit import default_timer
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+try:
+    from types import MappingProxyType
+except ImportError:
+    # Python 2 has no read-only mapping view
+    MappingProxyType = dict
+
 
 def get_attributes(obj):
     """Retrieve all attributes from an object."""
     return [getattr(obj, _) for _ in dir(obj)]
+
+
+def get_parameters(method):
+    """
+    Retrieve the names of the keyword arguments a method accepts.
+
+    Args:
+        method (function): the method, as found on its class, its first
+                           parameter being 'self'.
+
+    Returns:
+        frozenset: the accepted names, or None when the method accepts any
+                   keyword argument, or can't be introspected.
+    """
+
+    method = getattr(method, '__func__', method)
+    try:
+        signature = inspect.signature(method)
+    except AttributeError:
+        # Python 2
+        try:
+            spec = inspect.getargspec(method)
+        except TypeError:
+            return None
+        if spec.keywords:
+            return None
+        return frozenset(spec.args[1:])
+    except (TypeError, ValueError):
+        return None
+
+    names = []
+    for parameter in list(signature.parameters.values())[1:]:
+        if parameter.kind == parameter.VAR_KEYWORD:
+            return None
+        if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD,
+                              parameter.KEYWORD_ONLY):
+            names.append(parameter.name)
+    return frozenset(names)
+
+
+def is_overridden(cls, name):
+    """Tell whether a class overrides the base implementation of a method."""
+    return len([klass for klass in cls.__mro__ if name in klass.__dict__]) > 1
+
+
+def chunked(iterable, size):
+    """Lazily split an iterable into lists of at most 'size' items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class LRUCache(object):
+    """
+    Thread-safe, bounded, least recently used cache.
+
+    Args:
+        maxsize (int): maximum number of entries. The least recently used
+                       entry is evicted whenever it is exceeded.
+        ttl (float): when set, entries expire this many seconds after being
+                     stored.
+
+    Attributes:
+        hits (int): number of lookups that found a live entry.
+        misses (int): number of lookups that didn't.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Look an entry up.
+
+        Returns:
+            tuple: (True, value) when found, or (False, None) otherwise.
+
+        Raises:
+            TypeError: the key is not hashable.
+        """
+
+        with self.lock:
+            try:
+                value, expires = self.entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return False, None
+            if expires is not None and expires < default_timer():
+                self.misses += 1
+                return False, None
+            # reinserting the entry marks it as the most recently used
+            self.entries[key] = (value, expires)
+            self.hits += 1
+            return True, value
+
+    def set(self, key, value):
+        """Store an entry, evicting the least recently used one if needed."""
+        expires = None
+        if self.ttl is not None:
+            expires = default_timer() + self.ttl
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expires)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Discard every entry and reset the statistics."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """Retrieve the cache's statistics, as a dict."""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self.entries), 'maxsize': self.maxsize}
+
+
+class Overlay(object):
+    """
+    Read-only mapping layering a set of changes over a base mapping.
+
+    Neither mapping is copied, nor modified. Overlays of overlays are
+    flattened, so lookups never go through more than two mappings.
+
+    Args:
+        base (dict): dict-like object.
+        changes (dict): values overriding, or adding to, the base's.
+    """
+
+    def __init__(self, base, changes):
+        if isinstance(base, Overlay):
+            merged = dict(base.changes)
+            merged.update(changes)
+            base, changes = base.base, merged
+        self.base = base
+        self.changes = changes
+
+    def __getitem__(self, key):
+        try:
+            return self.changes[key]
+        except KeyError:
+            return self.base[key]
+
+    def __contains__(self, key):
+        return key in self.changes or key in self.base
+
+    def __iter__(self):
+        for key in self.base:
+            yield key
+        for key in self.changes:
+            if key not in self.base:
+                yield key
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
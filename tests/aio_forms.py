@@ -0,0 +1,54 @@
+"""
+Forms defining coroutines, for tests/test_aio.py.
+
+They live in their own module, which is only imported on Python versions
+asyncio.run() is available on, as older ones can't even parse them.
+"""
+
+import asyncio
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import SubmitError
+from formscribe.error import ValidationError
+from tests.helpers import StatefulTest
+
+
+class AsyncForm(Form):
+    class Email(Field):
+        key = 'email'
+
+        async def validate(self, value):
+            StatefulTest.world['events'].append('email-start')
+            await asyncio.sleep(0.05)
+            StatefulTest.world['events'].append('email-end')
+            if not value:
+                raise ValidationError('Email is required.')
+            return value
+
+    class Username(Field):
+        key = 'username'
+
+        async def validate(self, value):
+            StatefulTest.world['events'].append('username-start')
+            await asyncio.sleep(0.05)
+            StatefulTest.world['events'].append('username-end')
+            if not value:
+                raise ValidationError('Username is required.')
+            return value
+
+        async def submit(self, value):
+            StatefulTest.world['submitted_username'] = value
+
+    class Password(Field):
+        key = 'password'
+        when_validated = ['username']
+
+        def validate(self, value):
+            StatefulTest.world['events'].append('password')
+            return value
+
+    async def submit(self, email, password, username):
+        if username == 'taken':
+            raise SubmitError('Username is taken.')
+        StatefulTest.world['submitted'] = (email, password, username)
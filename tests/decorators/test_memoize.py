@@ -0,0 +1,139 @@
+import gc
+import time
+import weakref
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.decorators import memoize
+from formscribe.decorators import required
+from formscribe.error import ValidationError
+from formscribe.util import LRUCache
+from tests.helpers import StatefulTest
+
+
+class MemoizedForm(Form):
+    @memoize(maxsize=2)
+    @required('Country is required.')
+    class Country(Field):
+        key = 'country'
+
+        def validate(self, value):
+            StatefulTest.world['calls'] += 1
+            if value not in ('BR', 'DE', 'FR'):
+                raise ValidationError('Unknown country.')
+            return value.lower()
+
+
+class CodedError(ValidationError):
+    def __init__(self, message, code):
+        super(CodedError, self).__init__(message)
+        self.code = code
+
+
+class CodedForm(Form):
+    @memoize()
+    class Code(Field):
+        key = 'code'
+
+        def validate(self, value):
+            StatefulTest.world['calls'] += 1
+            raise CodedError('Invalid code.', 'invalid')
+
+
+class TestMemoize(StatefulTest):
+    def setUp(self):
+        super(TestMemoize, self).setUp()
+        StatefulTest.world['calls'] = 0
+        self.cache = MemoizedForm.Country.validate.cache
+        self.cache.clear()
+
+    def test_hits(self):
+        for _ in range(3):
+            form = MemoizedForm({'country': 'BR'})
+            self.assertEqual(form.values[MemoizedForm.Country], 'br')
+        self.assertEqual(StatefulTest.world['calls'], 1)
+        self.assertEqual(self.cache.info(), {'hits': 2, 'misses': 1,
+                                             'size': 1, 'maxsize': 2})
+
+    def test_errors_are_cached(self):
+        for value, message in (('XX', 'Unknown country.'), ('XX', None),
+                               (' ', 'Country is required.'), (' ', None)):
+            form = MemoizedForm({'country': value})
+            self.assertEqual(len(form.errors), 1)
+            if message:
+                self.assertEqual(form.errors[0].message, message)
+        self.assertEqual(StatefulTest.world['calls'], 1)
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_cached_errors_are_fresh(self):
+        first = MemoizedForm({'country': 'XX'}).errors[0]
+        second = MemoizedForm({'country': 'XX'}).errors[0]
+        self.assertIsNot(first, second)
+        self.assertEqual(second.message, 'Unknown country.')
+
+    def test_cached_error_subclasses(self):
+        CodedForm.Code.validate.cache.clear()
+        errors = [CodedForm({'code': 'x'}).errors[0] for _ in range(2)]
+        self.assertEqual(StatefulTest.world['calls'], 1)
+        self.assertIsNot(errors[0], errors[1])
+        for error in errors:
+            self.assertIsInstance(error, CodedError)
+            self.assertEqual(error.message, 'Invalid code.')
+            self.assertEqual(error.code, 'invalid')
+
+    def test_cached_errors_release_forms(self):
+        form = MemoizedForm({'country': 'XX'})
+        reference = weakref.ref(form)
+        del form
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_eviction(self):
+        for value in ('BR', 'DE', 'FR', 'BR'):
+            MemoizedForm({'country': value})
+        self.assertEqual(StatefulTest.world['calls'], 4)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_unhashable_values_bypass_the_cache(self):
+        form = MemoizedForm({'country': ['BR']})
+        self.assertEqual(form.errors[0].message, 'Unknown country.')
+        form = MemoizedForm({'country': ['BR']})
+        self.assertEqual(StatefulTest.world['calls'], 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_value_type_is_part_of_the_key(self):
+        @memoize()
+        class Number(Field):
+            key = 'number'
+
+            def validate(self, value):
+                return repr(value)
+
+        field = Number()
+        self.assertEqual(field.validate(1), '1')
+        self.assertEqual(field.validate(True), 'True')
+        self.assertEqual(field.validate(1.0), '1.0')
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), (True, 1))
+        cache.set('c', 3)
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.get('c'), (True, 3))
+
+    def test_ttl(self):
+        cache = LRUCache(ttl=0.01)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), (True, 1))
+        time.sleep(0.02)
+        self.assertEqual(cache.get('a'), (False, None))
+        self.assertEqual(len(cache), 0)
+
+    def test_unhashable_key(self):
+        self.assertRaises(TypeError, LRUCache().get, ['a'])
@@ -0,0 +1,69 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.decorators import boolean
+from formscribe.decorators import integer
+from formscribe.decorators import oneof
+from formscribe.decorators import required
+from tests.helpers import StatefulTest
+
+
+class PipelineForm(Form):
+    @required('Age is required.')
+    @integer('Age must be an integer.')
+    @oneof([18, 21, 65], 'Invalid age.')
+    class Age(Field):
+        key = 'age'
+
+        def validate(self, value):
+            StatefulTest.world['age'] = value
+            return value
+
+
+class TestPipeline(StatefulTest):
+    def test_single_pipeline(self):
+        validate = PipelineForm.Age.__dict__['validate']
+        self.assertEqual(len(validate.steps), 3)
+
+    def test_outermost_decorator_runs_first(self):
+        for value, message in ((' ', 'Age is required.'),
+                               ('abc', 'Age must be an integer.'),
+                               ('30', 'Invalid age.')):
+            form = PipelineForm({'age': value})
+            self.assertEqual([error.message for error in form.errors],
+                             [message])
+
+    def test_success(self):
+        form = PipelineForm({'age': '21'})
+        self.assertFalse(form.errors)
+        self.assertEqual(StatefulTest.world['age'], 21)
+
+    def test_decorated_subclass(self):
+        @boolean
+        class Parent(Field):
+            key = 'parent'
+
+            def validate(self, value):
+                return value
+
+        @required('Child is required.')
+        class Child(Parent):
+            pass
+
+        self.assertEqual(Parent.__dict__['validate'].steps, [bool])
+        self.assertEqual(len(Child.__dict__['validate'].steps), 1)
+        self.assertEqual(Child().validate('x'), True)
+
+
+class TestOneOfUnhashable(unittest.TestCase):
+    def test_unhashable_value(self):
+        @oneof(['a', ['b']], 'Invalid.')
+        class Choice(Field):
+            key = 'choice'
+
+            def validate(self, value):
+                return value
+
+        self.assertEqual(Choice().validate(['b']), ['b'])
+        self.assertEqual(Choice().validate('a'), 'a')
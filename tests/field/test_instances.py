@@ -0,0 +1,76 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import InvalidFieldError
+from tests.helpers import StatefulTest
+
+
+class InstancesForm(Form):
+    class Name(Field):
+        key = 'name'
+
+        def __init__(self):
+            StatefulTest.world['instances'].append(self)
+
+        def enabled(self):
+            return True
+
+        def validate(self, value):
+            StatefulTest.world['validated_by'] = self
+            return value
+
+        def submit(self, value):
+            StatefulTest.world['submitted_by'] = self
+
+    class Tag(Field):
+        regex_group = 'tags'
+        regex_group_key = 'tag'
+        regex_key = r'tag-(\d+)'
+        stateless = True
+
+        def __init__(self):
+            StatefulTest.world['instances'].append(self)
+
+        def validate(self, value):
+            return value
+
+
+class TestFieldInstances(StatefulTest):
+    def setUp(self):
+        super(TestFieldInstances, self).setUp()
+        StatefulTest.world['instances'] = []
+        InstancesForm.get_schema().field_instances.clear()
+
+    def test_single_instance_per_form(self):
+        InstancesForm({'name': 'john', 'tag-1': 'a', 'tag-2': 'b'})
+        instances = StatefulTest.world['instances']
+        self.assertEqual(len(instances), 2)
+        self.assertTrue(StatefulTest.world['validated_by'] is
+                        StatefulTest.world['submitted_by'])
+
+    def test_stateless_instance_shared(self):
+        InstancesForm({'name': 'john', 'tag-1': 'a'})
+        InstancesForm({'name': 'mary', 'tag-1': 'b'})
+        names = [instance for instance in StatefulTest.world['instances']
+                 if isinstance(instance, InstancesForm.Name)]
+        tags = [instance for instance in StatefulTest.world['instances']
+                if isinstance(instance, InstancesForm.Tag)]
+        self.assertEqual(len(names), 2)
+        self.assertEqual(len(tags), 1)
+
+    def test_reused_across_rows(self):
+        rows = [{'name': str(index)} for index in range(5)]
+        list(InstancesForm.validate_many(rows))
+        self.assertEqual(len(StatefulTest.world['instances']), 2)
+
+
+class TestInvalidFieldInForm(unittest.TestCase):
+    def test_raised_on_form_definition(self):
+        def define():
+            class InvalidForm(Form):
+                class Empty(Field):
+                    def validate(self, value):
+                        return value
+
+        self.assertRaises(InvalidFieldError, define)
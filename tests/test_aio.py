@@ -0,0 +1,116 @@
+import sys
+import unittest
+
+from formscribe import Form
+from formscribe import VALIDATE_FIELDS
+from formscribe.instrumentation import ERROR
+from formscribe.instrumentation import HistogramObserver
+from formscribe.instrumentation import SKIPPED_DEPENDENCY
+from formscribe.instrumentation import SKIPPED_DISABLED
+from formscribe.instrumentation import VALIDATED
+from tests.helpers import StatefulTest
+from tests.test_instrumentation import InstrumentedForm
+from tests.test_instrumentation import RecordingObserver
+from tests.test_modes import ModesForm
+
+if sys.version_info >= (3, 7):
+    import asyncio
+
+    from formscribe.aio import validate_async
+    from tests.aio_forms import AsyncForm
+
+
+@unittest.skipIf(sys.version_info < (3, 7),
+                 'asyncio.run() requires Python 3.7 or newer.')
+class TestAsync(StatefulTest):
+    def setUp(self):
+        super(TestAsync, self).setUp()
+        StatefulTest.world['events'] = []
+        StatefulTest.world['phases'] = []
+
+    def run_form(self, data):
+        return asyncio.run(validate_async(AsyncForm, data))
+
+    def test_submit(self):
+        form = self.run_form({'email': 'a@b.c', 'password': 'secret',
+                              'username': 'john'})
+        self.assertEqual(form.errors, [])
+        self.assertTrue(form.submitted)
+        self.assertEqual(StatefulTest.world['submitted'],
+                         ('a@b.c', 'secret', 'john'))
+        self.assertEqual(StatefulTest.world['submitted_username'], 'john')
+
+    def test_independent_fields_run_concurrently(self):
+        self.run_form({'email': 'a@b.c', 'password': 'secret',
+                       'username': 'john'})
+        events = StatefulTest.world['events']
+        self.assertEqual(set(events[:2]), set(['email-start',
+                                               'username-start']))
+        self.assertTrue(events.index('password') >
+                        events.index('username-end'))
+
+    def test_dependencies_honoured(self):
+        form = self.run_form({'email': '', 'password': 'secret',
+                              'username': ''})
+        self.assertEqual([error.message for error in form.errors],
+                         ['Email is required.', 'Username is required.'])
+        self.assertFalse('password' in StatefulTest.world['events'])
+        self.assertFalse(form.submitted)
+
+    def test_form_submit_error(self):
+        form = self.run_form({'email': 'a@b.c', 'password': 'secret',
+                              'username': 'taken'})
+        self.assertEqual([error.message for error in form.errors],
+                         ['Username is taken.'])
+
+    def test_error_budget(self):
+        form = asyncio.run(validate_async(
+            AsyncForm, {'email': '', 'password': 'secret', 'username': ''},
+            error_budget=1))
+        self.assertTrue(form.aborted)
+        self.assertEqual([error.message for error in form.errors],
+                         ['Email is required.'])
+        self.assertEqual(set(form.unevaluated),
+                         set([AsyncForm.Username, AsyncForm.Password]))
+        self.assertFalse(AsyncForm.Username in form.values)
+        self.assertFalse(form.submitted)
+
+        form = asyncio.run(validate_async(
+            AsyncForm, {'email': 'a@b.c', 'password': 'secret',
+                        'username': 'john'}, error_budget=1))
+        self.assertFalse(form.aborted)
+        self.assertTrue(form.submitted)
+
+    def test_invalid_error_budget(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(validate_async(AsyncForm, {}, error_budget=0))
+
+    def test_observer(self):
+        observer = RecordingObserver()
+        asyncio.run(validate_async(
+            InstrumentedForm, {'mode': 'tags', 'name': '', 'tag-1': 'a',
+                               'tag-2': 'b'}, observer=observer))
+        self.assertEqual(set(observer.calls), set([
+            (InstrumentedForm.Disabled, SKIPPED_DISABLED, 0),
+            (InstrumentedForm.Mode, VALIDATED, 0),
+            (InstrumentedForm.Name, ERROR, 0),
+            (InstrumentedForm.Nickname, SKIPPED_DEPENDENCY, 0),
+            (InstrumentedForm.Tag, VALIDATED, 2),
+        ]))
+
+        observer = HistogramObserver()
+        asyncio.run(validate_async(AsyncForm, {'email': 'a@b.c'},
+                                   observer=observer))
+        self.assertEqual(sorted(observer.export()),
+                         ['AsyncForm.Email', 'AsyncForm.Password',
+                          'AsyncForm.Username'])
+
+    def test_kwargs(self):
+        form = asyncio.run(validate_async(Form, {}, session='session'))
+        self.assertEqual(form.session, 'session')
+        self.assertTrue(form.submitted)
+
+    def test_modes(self):
+        asyncio.run(validate_async(ModesForm, {'name': 'john'},
+                                   mode=VALIDATE_FIELDS))
+        self.assertEqual(StatefulTest.world['phases'], ['field-validate'])
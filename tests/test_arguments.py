@@ -0,0 +1,99 @@
+from formscribe import Field
+from formscribe import Form
+from tests.helpers import StatefulTest
+
+
+class Name(Field):
+    key = 'name'
+
+    def validate(self, value):
+        return value
+
+
+class Tag(Field):
+    regex_key = r'^tag-(\d+)$'
+    regex_group = 'tags'
+    regex_group_key = 'value'
+
+    def validate(self, value):
+        return value
+
+
+class NameOnlyForm(Form):
+    name = Name
+    tag = Tag
+
+    def validate(self, name):
+        StatefulTest.world['validate'] = name
+
+    def submit(self, name):
+        StatefulTest.world['submit'] = name
+
+
+class SubsetForm(Form):
+    name = Name
+    tag = Tag
+
+    def validate(self, name):
+        StatefulTest.world['validate'] = name
+
+    def submit(self, name, tags):
+        StatefulTest.world['submit'] = (name, tags)
+
+
+class AnyForm(Form):
+    name = Name
+    tag = Tag
+
+    def submit(self, **kwargs):
+        StatefulTest.world['submit'] = kwargs
+
+
+class SilentForm(Form):
+    name = Name
+    tag = Tag
+
+
+class TestArguments(StatefulTest):
+    def test_signatures(self):
+        schema = SubsetForm.get_schema()
+        self.assertEqual(schema.validate_parameters, frozenset(['name']))
+        self.assertEqual(schema.submit_parameters,
+                         frozenset(['name', 'tags']))
+        self.assertEqual(schema.parameters, frozenset(['name', 'tags']))
+        self.assertIsNone(AnyForm.get_schema().parameters)
+        self.assertFalse(AnyForm.get_schema().validates)
+        self.assertTrue(AnyForm.get_schema().submits)
+
+    def test_groups_not_built(self):
+        form = NameOnlyForm({'name': 'john', 'tag-1': 'a'})
+        self.assertEqual(StatefulTest.world['validate'], 'john')
+        self.assertEqual(StatefulTest.world['submit'], 'john')
+        self.assertEqual(dict(form.arguments), {'name': 'john'})
+
+    def test_subset(self):
+        form = SubsetForm({'name': 'john', 'tag-1': 'a'})
+        self.assertEqual(StatefulTest.world['validate'], 'john')
+        self.assertEqual(StatefulTest.world['submit'],
+                         ('john', [{'value': 'a', 'matches': ['1']}]))
+        self.assertTrue(form.submitted)
+
+    def test_any(self):
+        AnyForm({'name': 'john', 'tag-1': 'a'})
+        self.assertEqual(StatefulTest.world['submit'],
+                         {'name': 'john',
+                          'tags': [{'value': 'a', 'matches': ['1']}]})
+
+    def test_read_only(self):
+        form = NameOnlyForm({'name': 'john'})
+        with self.assertRaises(TypeError):
+            form.arguments['name'] = 'mary'
+
+    def test_regex_values_untouched(self):
+        form = SubsetForm({'name': 'john', 'tag-1': 'a'})
+        self.assertEqual(form.regex_values, {'tags': {('1',): {'value': 'a'}}})
+
+    def test_not_implemented(self):
+        form = SilentForm({'name': 'john', 'tag-1': 'a'})
+        self.assertIsNone(form.arguments)
+        self.assertTrue(form.submitted)
@@ -0,0 +1,103 @@
+import itertools
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import SubmitError
+from formscribe.error import ValidationError
+
+
+class BatchForm(Form):
+    class Age(Field):
+        key = 'age'
+
+        def validate(self, value):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                raise ValidationError('Invalid age.')
+
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            return value
+
+    def submit(self, age, name):
+        if name == 'forbidden':
+            raise SubmitError('Forbidden name.')
+        self.submitted_rows.append((name, age))
+
+
+class TestValidateMany(unittest.TestCase):
+    def test_results(self):
+        submitted_rows = []
+        rows = [
+            {'age': '30', 'name': 'john'},
+            {'age': 'x', 'name': 'mary'},
+            {'age': '40', 'name': 'forbidden'},
+        ]
+        results = list(BatchForm.validate_many(rows,
+                                               submitted_rows=submitted_rows))
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].values, {'age': 30, 'name': 'john'})
+        self.assertEqual(results[0].errors, [])
+        self.assertTrue(results[0].submitted)
+
+        self.assertEqual(results[1].values, {'age': None, 'name': 'mary'})
+        self.assertEqual([error.message for error in results[1].errors],
+                         ['Invalid age.'])
+        self.assertFalse(results[1].submitted)
+
+        self.assertEqual([error.message for error in results[2].errors],
+                         ['Forbidden name.'])
+        self.assertFalse(results[2].submitted)
+
+        self.assertEqual(submitted_rows, [('john', 30)])
+
+    def test_lazy(self):
+        def rows():
+            yield {'age': '1', 'name': 'a'}
+            raise AssertionError('Rows must be consumed lazily.')
+
+        results = BatchForm.validate_many(rows(), submitted_rows=[])
+        self.assertTrue(next(results).submitted)
+
+    def test_no_form_per_row(self):
+        instances = []
+
+        class CountingForm(BatchForm):
+            def __init__(self, *args, **kwargs):
+                instances.append(self)
+                super(CountingForm, self).__init__(*args, **kwargs)
+
+        rows = [{'age': str(age), 'name': 'a'} for age in range(10)]
+        results = list(CountingForm.validate_many(rows, submitted_rows=[]))
+        self.assertEqual(len(results), 10)
+        self.assertEqual(instances, [])
+
+
+class TestValidateStream(unittest.TestCase):
+    def records(self, count):
+        for index in range(count):
+            yield {'age': str(index), 'name': 'name-%d' % index}
+
+    def test_one_by_one(self):
+        results = BatchForm.validate_stream(self.records(3),
+                                            submitted_rows=[])
+        self.assertEqual([result.values['age'] for result in results],
+                         [0, 1, 2])
+
+    def test_unbounded(self):
+        def records():
+            index = 0
+            while True:
+                yield {'age': str(index), 'name': 'a'}
+                index += 1
+
+        results = BatchForm.validate_stream(records(), submitted_rows=[])
+        self.assertEqual([result.values['age']
+                          for result in itertools.islice(results, 100)],
+                         list(range(100)))
+        self.assertEqual(next(results).values['age'], 100)
@@ -0,0 +1,11 @@
+import unittest
+
+from benchmarks.cases import CASES
+
+
+class TestBenchmarkCases(unittest.TestCase):
+    """Make sure every benchmark case runs without errors."""
+
+    def test_cases(self):
+        for case in CASES:
+            case()()
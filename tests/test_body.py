@@ -0,0 +1,184 @@
+import io
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.body import MultipartReader
+from formscribe.body import parse_body
+from formscribe.body import parse_options_header
+from formscribe.body import parse_urlencoded
+from formscribe.error import MalformedBodyError
+from tests.helpers import StatefulTest
+
+
+class BodyForm(Form):
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            return value
+
+    class Tag(Field):
+        regex_key = r'^tag-(\d+)$'
+        regex_group = 'tags'
+        regex_group_key = 'value'
+
+        def validate(self, value):
+            return value
+
+    def submit(self, name, tags):
+        StatefulTest.world['submitted'] = (name, tags)
+
+
+def multipart(parts, boundary='boundary'):
+    body = b'preamble'
+    for headers, content in parts:
+        body += b'\r\n--' + boundary.encode('ascii') + b'\r\n'
+        for header in headers:
+            body += header.encode('utf-8') + b'\r\n'
+        body += b'\r\n' + content
+    return body + b'\r\n--' + boundary.encode('ascii') + b'--\r\nepilogue'
+
+
+class Chunks(io.RawIOBase):
+    """Stream returning at most 'size' bytes per read."""
+
+    def __init__(self, data, size):
+        self.stream = io.BytesIO(data)
+        self.size = size
+
+    def read(self, size=-1):
+        return self.stream.read(min(size, self.size))
+
+
+class TestOptionsHeader(unittest.TestCase):
+    def test_options(self):
+        self.assertEqual(
+            parse_options_header('Multipart/Form-Data; boundary="a;b"'),
+            ('multipart/form-data', {'boundary': 'a;b'}))
+        self.assertEqual(
+            parse_options_header('form-data; name="a\\"b"; filename=x.txt'),
+            ('form-data', {'name': 'a"b', 'filename': 'x.txt'}))
+
+
+class TestUrlencoded(unittest.TestCase):
+    def test_wanted_keys_only(self):
+        wants = BodyForm.get_schema().wants
+        data = parse_urlencoded(
+            b'name=John+Doe&junk=%ZZ&tag-1=a%26b&tag-x=1&&name=other&empty',
+            wants)
+        self.assertEqual(data, {'name': 'John Doe', 'tag-1': 'a&b'})
+
+    def test_values_not_decoded_when_skipped(self):
+        decoded = []
+
+        def wants(key):
+            decoded.append(key)
+            return False
+
+        self.assertEqual(parse_urlencoded(b'a=1&b=2', wants), {})
+        self.assertEqual(decoded, ['a', 'b'])
+
+    def test_encoded_keys_and_blank_values(self):
+        data = parse_urlencoded(b'na%6De=&tag-2', lambda key: True)
+        self.assertEqual(data, {'name': '', 'tag-2': ''})
+
+
+class TestMultipart(unittest.TestCase):
+    def test_parts(self):
+        body = multipart([
+            (['Content-Disposition: form-data; name="name"'], b'J\xc3\xa9r'),
+            (['Content-Disposition: form-data; name="junk"'], b'x' * 1000),
+            (['Content-Disposition: form-data; name="tag-1"'],
+             b'line\r\n-- not a boundary'),
+            (['Content-Disposition: form-data; name="tag-2";'
+              ' filename="a.bin"',
+              'Content-Type: application/octet-stream'], b'\x00\x01'),
+        ])
+        wants = BodyForm.get_schema().wants
+        for size in (1, 7, 64 * 1024):
+            reader = MultipartReader(Chunks(body, size), b'boundary', wants)
+            self.assertEqual(reader.read(), {
+                'name': u'J\xe9r',
+                'tag-1': 'line\r\n-- not a boundary',
+                'tag-2': b'\x00\x01',
+            })
+
+    def test_skipped_parts_are_not_buffered(self):
+        body = multipart([
+            (['Content-Disposition: form-data; name="junk"'],
+             b'x' * (1024 * 1024)),
+            (['Content-Disposition: form-data; name="name"'], b'john'),
+        ])
+        stream = Chunks(body, 1024)
+        reader = MultipartReader(stream, b'boundary', lambda key: key ==
+                                 'name', chunk_size=1024)
+        original = reader.fill
+        sizes = []
+
+        def fill():
+            sizes.append(len(reader.buffer))
+            return original()
+
+        reader.fill = fill
+        self.assertEqual(reader.read(), {'name': 'john'})
+        self.assertTrue(max(sizes) < 2048)
+
+    def test_open_file(self):
+        body = multipart([
+            (['Content-Disposition: form-data; name="name";'
+              ' filename="a.txt"', 'Content-Type: text/plain'], b'content'),
+            (['Content-Disposition: form-data; name="raw"'], b'raw'),
+            (['Content-Disposition: form-data; name="text"'], b'text'),
+        ])
+        opened = []
+
+        def open_file(name, filename, content_type):
+            opened.append((name, filename, content_type))
+            if name == 'text':
+                return None
+            return io.BytesIO()
+
+        data = MultipartReader(io.BytesIO(body), b'boundary',
+                               lambda key: True, open_file=open_file).read()
+        self.assertEqual(opened, [('name', 'a.txt', 'text/plain'),
+                                  ('raw', None, 'text/plain'),
+                                  ('text', None, 'text/plain')])
+        self.assertEqual(data['name'].read(), b'content')
+        self.assertEqual(data['raw'].read(), b'raw')
+        self.assertEqual(data['text'], 'text')
+
+    def test_malformed(self):
+        body = multipart([
+            (['Content-Disposition: form-data; name="name"'], b'john'),
+        ])
+        for broken in (body[:-20], b'no boundary at all',
+                       body.replace(b'Content-Disposition:', b'Broken')):
+            with self.assertRaises(MalformedBodyError):
+                MultipartReader(io.BytesIO(broken), b'boundary',
+                                lambda key: True).read()
+
+
+class TestFromBody(StatefulTest):
+    def test_urlencoded(self):
+        form = BodyForm.from_body(b'name=john&tag-1=a&other=1',
+                                  'application/x-www-form-urlencoded')
+        self.assertTrue(form.submitted)
+        self.assertEqual(form.data, {'name': 'john', 'tag-1': 'a'})
+
+    def test_multipart(self):
+        body = multipart([
+            (['Content-Disposition: form-data; name="name"'], b'john'),
+            (['Content-Disposition: form-data; name="tag-3"'], b'c'),
+        ], boundary='xyz')
+        BodyForm.from_body(io.BytesIO(body),
+                           'multipart/form-data; boundary=xyz')
+        self.assertEqual(StatefulTest.world['submitted'],
+                         ('john', [{'value': 'c', 'matches': ['3']}]))
+
+    def test_unsupported(self):
+        schema = BodyForm.get_schema()
+        with self.assertRaises(MalformedBodyError):
+            parse_body(schema, b'{}', 'application/json')
+        with self.assertRaises(MalformedBodyError):
+            parse_body(schema, b'', 'multipart/form-data')
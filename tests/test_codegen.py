@@ -0,0 +1,130 @@
+import traceback
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import ValidationError
+from formscribe.instrumentation import Observer
+from tests.helpers import StatefulTest
+
+
+class GeneratedForm(Form):
+    compiled = True
+
+    class Race(Field):
+        key = 'race'
+
+        def validate(self, value):
+            if value not in ('elf', 'orc'):
+                raise ValidationError('Invalid race.')
+            return value
+
+    class Clan(Field):
+        key = 'clan'
+        when_value = {'race': 'orc'}
+
+        def validate(self, value):
+            if not value:
+                return ValidationError('Orcs need a clan.')
+            return value
+
+    class Weapon(Field):
+        key = 'weapon'
+        when_validated = ['race']
+
+        def validate(self, value):
+            return value
+
+    class Secret(Field):
+        key = 'secret'
+
+        def enabled(self):
+            return StatefulTest.world.get('secret', False)
+
+        def validate(self, value):
+            return value
+
+    class ItemName(Field):
+        regex_key = r'^item-(\d+)-name$'
+        regex_group = 'items'
+        regex_group_key = 'name'
+
+        def validate(self, value):
+            if not value:
+                raise ValidationError('Items need a name.')
+            return value
+
+    def submit(self, **kwargs):
+        StatefulTest.world['submitted'] = True
+
+
+class CustomForm(GeneratedForm):
+    def prepare_field(self, field):
+        return super(CustomForm, self).prepare_field(field)
+
+
+class BrokenForm(Form):
+    compiled = True
+
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            raise RuntimeError('Broken.')
+
+
+PAYLOADS = [
+    {},
+    {'race': 'orc', 'clan': 'blood', 'weapon': 'axe'},
+    {'race': 'orc', 'clan': '', 'weapon': 'axe'},
+    {'race': 'elf', 'clan': '', 'weapon': 'bow', 'secret': 'x'},
+    {'race': 'dwarf', 'weapon': 'hammer', 'item-2-name': 'b',
+     'item-1-name': 'a', 'item-3-name': ''},
+]
+
+
+def snapshot(form):
+    return (form.values, form.regex_values,
+            [error.message for error in form.errors], form.error_fields,
+            bytes(form.status), form.submitted)
+
+
+class TestCodegen(StatefulTest):
+    def test_same_outcome(self):
+        for secret in (False, True):
+            StatefulTest.world['secret'] = secret
+            for payload in PAYLOADS:
+                generated = GeneratedForm(payload)
+                generic = GeneratedForm(payload, compiled=False)
+                self.assertEqual(snapshot(generated), snapshot(generic))
+
+    def test_cached_on_class(self):
+        validator = GeneratedForm.get_validator()
+        self.assertIs(GeneratedForm.get_validator(), validator)
+        self.assertIn('def validate_fields(form):', validator.source)
+        self.assertIn('# Clan', validator.source)
+
+    def test_overridden_methods(self):
+        self.assertIsNone(CustomForm.get_validator())
+        form = CustomForm({'race': 'orc', 'clan': 'blood'})
+        self.assertEqual(form.errors, [])
+
+    def test_fallbacks(self):
+        class Counter(Observer):
+            calls = 0
+
+            def field_finished(self, *args):
+                Counter.calls += 1
+
+        GeneratedForm({'race': 'orc'}, observer=Counter())
+        self.assertEqual(Counter.calls, 5)
+
+        form = GeneratedForm({'race': 'dwarf', 'item-1-name': ''},
+                             error_budget=1)
+        self.assertTrue(form.aborted)
+
+    def test_traceback_shows_source(self):
+        try:
+            BrokenForm({'name': 'john'})
+        except RuntimeError:
+            formatted = traceback.format_exc()
+        self.assertIn('instance.validate(get(K0))', formatted)
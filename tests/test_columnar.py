@@ -0,0 +1,163 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe import columnar
+from formscribe.columnar import validate_columns
+from formscribe.decorators import add_step
+from formscribe.decorators import boolean
+from formscribe.decorators import integer
+from formscribe.decorators import oneof
+from formscribe.decorators import required
+from formscribe.error import ValidationError
+from formscribe.instrumentation import HistogramObserver
+from tests.helpers import StatefulTest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ColumnarForm(Form):
+    @required('Age is required.')
+    @integer('Age must be an integer.')
+    class Age(Field):
+        key = 'age'
+
+        def validate(self, value):
+            StatefulTest.world['validated_ages'].append(value)
+            if value > 150:
+                raise ValidationError('Age is too high.')
+            return value
+
+    @boolean
+    class Active(Field):
+        key = 'active'
+
+        def validate(self, value):
+            return value
+
+    @oneof(['elf', 'orc'], 'Invalid race.')
+    class Race(Field):
+        key = 'race'
+
+        def validate(self, value):
+            return value
+
+    @oneof(['elf', 'orc'], 'Invalid clan race.')
+    class Clan(Field):
+        key = 'clan'
+        when_value = {'race': 'orc'}
+
+        def validate(self, value):
+            return value
+
+
+def counted(value):
+    StatefulTest.world['steps'] += 1
+    return value.upper()
+
+
+class CountedForm(Form):
+    class Code(Field):
+        key = 'code'
+
+        def validate(self, value):
+            return value
+
+    add_step(Code, counted)
+
+    def submit(self, code):
+        StatefulTest.world['codes'].append(self.values[CountedForm.Code])
+
+
+class TestColumnar(StatefulTest):
+    def setUp(self):
+        super(TestColumnar, self).setUp()
+        StatefulTest.world['validated_ages'] = []
+
+    def check(self, columns):
+        outcome = validate_columns(ColumnarForm, columns)
+        self.assertEqual(list(outcome.mask), [False, True, True, False])
+        messages = [[error.message for error in result.errors]
+                    for result in outcome.results]
+        self.assertEqual(messages, [[], ['Age must be an integer.'],
+                                    ['Age is required.', 'Invalid race.'],
+                                    ['Age is too high.']])
+        self.assertEqual(outcome.results[0].values['age'], 25)
+        self.assertEqual(outcome.results[0].values['active'], True)
+        self.assertTrue(outcome.results[0].submitted)
+        self.assertFalse(outcome.results[1].submitted)
+        # validate() only runs on rows passing the columnar checks
+        self.assertEqual(StatefulTest.world['validated_ages'], [25, 200])
+        return outcome
+
+    def test_lists(self):
+        self.check({
+            'active': [1, 0, 1, 0],
+            'age': ['25', 'x', ' ', '200'],
+            'race': ['elf', 'orc', 'dwarf', 'elf'],
+        })
+
+    def test_lists_without_numpy(self):
+        original, columnar.numpy = columnar.numpy, None
+        try:
+            outcome = self.check({
+                'active': [1, 0, 1, 0],
+                'age': ['25', 'x', ' ', '200'],
+                'race': ['elf', 'orc', 'dwarf', 'elf'],
+            })
+            self.assertEqual(outcome.mask, [False, True, True, False])
+        finally:
+            columnar.numpy = original
+
+    def test_dependent_fields_are_not_prechecked(self):
+        outcome = validate_columns(ColumnarForm, {
+            'age': ['1', '2'],
+            'clan': ['dwarf', 'dwarf'],
+            'race': ['elf', 'orc'],
+        })
+        self.assertEqual(list(outcome.mask), [False, False])
+        self.assertEqual(outcome.results[0].errors, [])
+        self.assertEqual([error.message for error in outcome.results[1].errors],
+                         ['Invalid clan race.'])
+
+    def test_checks_run_once_per_row(self):
+        StatefulTest.world['steps'] = 0
+        StatefulTest.world['codes'] = []
+        observer = HistogramObserver()
+        outcome = validate_columns(CountedForm, {'code': ['a', 'b', 'c']},
+                                   observer=observer)
+        self.assertEqual(StatefulTest.world['steps'], 3)
+        self.assertEqual([result.values['code'] for result in outcome.results],
+                         ['A', 'B', 'C'])
+        # rows are still processed with the Form class' own fields
+        self.assertEqual(StatefulTest.world['codes'], ['A', 'B', 'C'])
+        self.assertEqual(list(observer.export()), ['CountedForm.Code'])
+
+    def test_length_mismatch(self):
+        self.assertRaises(ValueError, validate_columns, ColumnarForm,
+                          {'age': ['1'], 'race': []})
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed.')
+    def test_numpy_arrays(self):
+        outcome = self.check({
+            'active': numpy.array([1, 0, 1, 0]),
+            'age': numpy.array(['25', 'x', ' ', '200']),
+            'race': numpy.array(['elf', 'orc', 'dwarf', 'elf']),
+        })
+        self.assertTrue(isinstance(outcome.mask, numpy.ndarray))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed.')
+    def test_numpy_numeric_columns(self):
+        outcome = validate_columns(ColumnarForm, {
+            'active': numpy.array([True, False, True]),
+            'age': numpy.array([30, 0, 40]),
+            'race': numpy.array(['elf', 'orc', 'orc']),
+        })
+        self.assertEqual(list(outcome.mask), [False, True, False])
+        self.assertEqual(outcome.results[2].values['age'], 40)
+        self.assertTrue(type(outcome.results[2].values['age']) is int)
+        self.assertEqual(outcome.results[1].errors[0].message,
+                         'Age is required.')
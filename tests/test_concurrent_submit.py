@@ -0,0 +1,89 @@
+import threading
+import time
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import SubmitError
+from tests.helpers import StatefulTest
+
+
+def slow_field(name, concurrent_submit=True, fail=False):
+    def validate(self, value):
+        return value
+
+    def submit(self, value):
+        time.sleep(0.05)
+        StatefulTest.world['threads'][name] = threading.current_thread()
+        if fail:
+            raise SubmitError(name)
+
+    return type(name, (Field,), {'key': name.lower(),
+                                 'concurrent_submit': concurrent_submit,
+                                 'validate': validate,
+                                 'submit': submit})
+
+
+class ConcurrentSubmitForm(Form):
+    submit_workers = 4
+
+    A = slow_field('A', fail=True)
+    B = slow_field('B')
+    C = slow_field('C', fail=True)
+    D = slow_field('D', concurrent_submit=False)
+
+    def submit(self, a, b, c, d):
+        StatefulTest.world['form_submitted'] = len(StatefulTest.world['threads'])
+
+
+class SequentialSubmitForm(ConcurrentSubmitForm):
+    submit_workers = None
+
+
+class TestConcurrentSubmit(StatefulTest):
+    data = {'a': 1, 'b': 2, 'c': 3, 'd': 4}
+
+    def setUp(self):
+        super(TestConcurrentSubmit, self).setUp()
+        StatefulTest.world['threads'] = {}
+
+    def test_concurrent(self):
+        started = time.time()
+        form = ConcurrentSubmitForm(self.data)
+        self.assertTrue(time.time() - started < 0.15)
+
+        threads = StatefulTest.world['threads']
+        self.assertFalse(threads['A'] is threading.current_thread())
+        self.assertTrue(threads['D'] is threading.current_thread())
+        self.assertEqual([error.message for error in form.errors], ['A', 'C'])
+
+    def test_form_submit_waits_for_fields(self):
+        class SucceedingForm(ConcurrentSubmitForm):
+            A = slow_field('A')
+            C = slow_field('C')
+
+        form = SucceedingForm(self.data)
+        self.assertEqual(form.errors, [])
+        self.assertEqual(StatefulTest.world['form_submitted'], 4)
+
+    def test_sequential(self):
+        form = SequentialSubmitForm(self.data)
+        for thread in StatefulTest.world['threads'].values():
+            self.assertTrue(thread is threading.current_thread())
+        self.assertEqual([error.message for error in form.errors], ['A', 'C'])
+
+    def test_workers_as_kwarg(self):
+        SequentialSubmitForm(self.data, submit_workers=2)
+        self.assertFalse(StatefulTest.world['threads']['B'] is
+                         threading.current_thread())
+
+    def test_pool_is_reused(self):
+        ConcurrentSubmitForm(self.data)
+        pool = ConcurrentSubmitForm.get_schema().get_submit_pool(4)
+        threads = threading.active_count()
+        for _ in range(3):
+            form = ConcurrentSubmitForm(self.data)
+            self.assertEqual([error.message for error in form.errors],
+                             ['A', 'C'])
+        self.assertEqual(threading.active_count(), threads)
+        self.assertTrue(ConcurrentSubmitForm.get_schema()
+                        .get_submit_pool(4) is pool)
@@ -0,0 +1,62 @@
+from formscribe import Field
+from formscribe import Form
+from tests.helpers import StatefulTest
+
+
+class MultiDict(object):
+    """Minimal framework-like mapping, holding a list of values per key."""
+
+    def __init__(self, pairs):
+        self.lists = {}
+        for key, value in pairs:
+            self.lists.setdefault(key, []).append(value)
+
+    def __iter__(self):
+        return iter(self.lists)
+
+    def __getitem__(self, key):
+        return self.lists[key][0]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        raise AssertionError('The data must not be copied.')
+
+
+class DataForm(Form):
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            return value
+
+    class Tag(Field):
+        regex_group = 'tags'
+        regex_group_key = 'tag'
+        regex_key = r'tag-(\d+)'
+
+        def validate(self, value):
+            StatefulTest.world.setdefault('tags', []).append(value)
+            return value
+
+
+class TestData(StatefulTest):
+    def test_data_is_not_copied(self):
+        data = {'name': 'john'}
+        form = DataForm(data)
+        self.assertTrue(form.data is data)
+
+    def test_multidict(self):
+        data = MultiDict([('tag-2', 'b'), ('name', 'john'), ('name', 'mary'),
+                          ('tag-1', 'a'), ('tag-3', 'c')])
+        form = DataForm(data)
+        self.assertEqual(form.errors, [])
+        self.assertEqual(form.values[DataForm.Name], 'john')
+
+    def test_regex_keys_are_sorted(self):
+        DataForm({'tag-3': 'c', 'tag-1': 'a', 'name': 'john', 'tag-2': 'b'})
+        self.assertEqual(StatefulTest.world['tags'], ['a', 'b', 'c'])
@@ -0,0 +1,64 @@
+import unittest
+
+from formscribe import Field
+from formscribe.schema import RegexDispatcher
+from formscribe.schema import literal_prefix
+
+
+def regex_field(name, regex_key):
+    return type(name, (Field,), {'regex_group': 'group',
+                                 'regex_group_key': name.lower(),
+                                 'regex_key': regex_key})
+
+
+class TestLiteralPrefix(unittest.TestCase):
+    def test_prefix(self):
+        self.assertEqual(literal_prefix(r'product-name-(\d+)'),
+                         'product-name-')
+        self.assertEqual(literal_prefix(r'^player-(\w+)'), 'player-')
+        self.assertEqual(literal_prefix('abc'), 'abc')
+
+    def test_optional_last_character(self):
+        self.assertEqual(literal_prefix('items?-(\\d+)'), 'item')
+        self.assertEqual(literal_prefix('ab*c'), 'a')
+        self.assertEqual(literal_prefix('ab{0,1}c'), 'a')
+
+    def test_no_prefix(self):
+        self.assertEqual(literal_prefix(r'(\d+)-name'), '')
+        self.assertEqual(literal_prefix('a-(1)|b-(2)'), '')
+        self.assertEqual(literal_prefix('(?i)name'), '')
+
+
+class TestRegexDispatcher(unittest.TestCase):
+    def test_dispatch(self):
+        name = regex_field('Name', r'product-name-(\d+)')
+        size = regex_field('Size', r'product-(\d+)-size-(\w+)')
+        dispatcher = RegexDispatcher([name, size])
+        self.assertTrue(dispatcher.combined is not None)
+
+        routes = dispatcher.dispatch(['other', 'product-name-1',
+                                      'product-2-size-xl', 'product-name-3'])
+        self.assertEqual(routes[name], [('product-name-1', ('1',)),
+                                        ('product-name-3', ('3',))])
+        self.assertEqual(routes[size], [('product-2-size-xl', (('2', 'xl'),))])
+
+    def test_unanchored_matches(self):
+        name = regex_field('Name', r'name-(\d+)')
+        routes = RegexDispatcher([name]).dispatch(['x-name-1-name-2'])
+        self.assertEqual(routes[name], [('x-name-1-name-2', ('1', '2'))])
+
+    def test_key_matching_several_fields(self):
+        first = regex_field('First', r'item-(\d+)')
+        second = regex_field('Second', r'(\d+)-x')
+        routes = RegexDispatcher([first, second]).dispatch(['item-1-x'])
+        self.assertEqual(routes[first], [('item-1-x', ('1',))])
+        self.assertEqual(routes[second], [('item-1-x', ('1',))])
+
+    def test_backreferences_are_not_combined(self):
+        first = regex_field('First', r'(a)-\1')
+        second = regex_field('Second', r'(b)-\1')
+        dispatcher = RegexDispatcher([first, second])
+        self.assertTrue(dispatcher.combined is None)
+        routes = dispatcher.dispatch(['b-b', 'a-a', 'a-b'])
+        self.assertEqual(routes[first], [('a-a', ('a',))])
+        self.assertEqual(routes[second], [('b-b', ('b',))])
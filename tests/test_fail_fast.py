@@ -0,0 +1,101 @@
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import ValidationError
+from tests.helpers import StatefulTest
+
+
+def required(value):
+    StatefulTest.world['validated'] += 1
+    if not value:
+        raise ValidationError('Required.')
+    return value
+
+
+class FailFastForm(Form):
+    class First(Field):
+        key = 'first'
+
+        def validate(self, value):
+            return required(value)
+
+    class Second(Field):
+        key = 'second'
+
+        def validate(self, value):
+            return required(value)
+
+    class Third(Field):
+        regex_key = r'^third_(\d+)$'
+        regex_group = 'third'
+        regex_group_key = 'value'
+
+        def validate(self, value):
+            return required(value)
+
+    def validate(self, first, second, third):
+        StatefulTest.world['form-validated'] = True
+
+    def submit(self, first, second, third):
+        pass
+
+
+class TestFailFast(StatefulTest):
+    def setUp(self):
+        super(TestFailFast, self).setUp()
+        StatefulTest.world['validated'] = 0
+        StatefulTest.world['form-validated'] = False
+
+    def test_no_budget(self):
+        form = FailFastForm({'third_1': '', 'third_2': ''})
+        self.assertEqual(len(form.errors), 4)
+        self.assertFalse(form.aborted)
+        self.assertEqual(form.unevaluated, [])
+        self.assertTrue(StatefulTest.world['form-validated'])
+
+    def test_invalid_budget(self):
+        for budget in (0, -1):
+            with self.assertRaises(ValueError):
+                FailFastForm({'first': 'x', 'second': 'x'},
+                             error_budget=budget)
+        self.assertEqual(StatefulTest.world['validated'], 0)
+
+        form = FailFastForm({'first': 'x', 'second': 'x'})
+        form.error_budget = 0
+        with self.assertRaises(ValueError):
+            form.revalidate({'first': ''})
+
+    def test_budget_stops_field_iteration(self):
+        form = FailFastForm({'second': 'x'}, error_budget=1)
+        self.assertTrue(form.aborted)
+        self.assertEqual(len(form.errors), 1)
+        self.assertEqual(StatefulTest.world['validated'], 1)
+        self.assertEqual(form.unevaluated,
+                         [FailFastForm.Second, FailFastForm.Third])
+        self.assertFalse(StatefulTest.world['form-validated'])
+        self.assertFalse(form.submitted)
+
+    def test_budget_stops_regex_scan(self):
+        data = dict(('third_%d' % index, '') for index in range(100))
+        data.update(first='x', second='x')
+        form = FailFastForm(data, error_budget=3)
+        self.assertTrue(form.aborted)
+        self.assertEqual(len(form.errors), 3)
+        self.assertEqual(StatefulTest.world['validated'], 5)
+        self.assertFalse(StatefulTest.world['form-validated'])
+
+    def test_budget_not_reached(self):
+        form = FailFastForm({'first': 'x', 'second': 'x', 'third_1': 'x'},
+                            error_budget=1)
+        self.assertFalse(form.aborted)
+        self.assertEqual(form.errors, [])
+        self.assertEqual(form.unevaluated, [])
+        self.assertTrue(StatefulTest.world['form-validated'])
+        self.assertTrue(form.submitted)
+
+    def test_revalidate(self):
+        form = FailFastForm({'first': '', 'second': ''}, error_budget=1)
+        self.assertTrue(form.aborted)
+        form.revalidate({'first': 'x'})
+        self.assertTrue(form.aborted)
+        self.assertEqual(len(form.errors), 1)
+        self.assertEqual(form.error_fields, [FailFastForm.Second])
@@ -0,0 +1,217 @@
+import datetime
+import decimal
+import enum
+import unittest
+
+from formscribe import Form
+from formscribe.error import ValidationError
+from formscribe.fields import BooleanField
+from formscribe.fields import DateField
+from formscribe.fields import DateTimeField
+from formscribe.fields import DecimalField
+from formscribe.fields import EmailField
+from formscribe.fields import EnumField
+from formscribe.fields import FloatField
+from formscribe.fields import IntegerField
+from formscribe.fields import StringField
+from tests.helpers import StatefulTest
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class Age(IntegerField):
+    key = 'age'
+    min_value = 0
+    max_value = 150
+
+
+class Price(DecimalField):
+    key = 'price'
+    places = 2
+    min_value = decimal.Decimal('0')
+
+
+class Ratio(FloatField):
+    key = 'ratio'
+    max_value = 1.0
+
+
+class Active(BooleanField):
+    key = 'active'
+
+
+class Birthday(DateField):
+    key = 'birthday'
+    max_value = datetime.date(2020, 1, 1)
+
+
+class EuropeanDate(DateField):
+    key = 'european'
+    format = '%d/%m/%Y'
+
+
+class Created(DateTimeField):
+    key = 'created'
+
+
+class Recent(DateTimeField):
+    key = 'recent'
+    min_value = datetime.datetime(2020, 1, 1)
+
+
+class Size(EnumField):
+    key = 'size'
+    choices = ['S', 'M', 'L']
+
+
+class Paint(EnumField):
+    key = 'paint'
+    choices = Color
+
+
+class Email(EmailField):
+    key = 'email'
+    required = True
+
+
+class Code(StringField):
+    key = 'code'
+    min_length = 2
+    max_length = 4
+    pattern = r'[A-Z]+'
+
+
+class Adult(IntegerField):
+    key = 'adult'
+
+    def check(self, value):
+        if value is not None and value < 18:
+            raise ValidationError('Too young.')
+        return value
+
+
+def coerce(field, value):
+    return field(value)
+
+
+def is_error(value):
+    return isinstance(value, ValidationError)
+
+
+class TestFields(unittest.TestCase):
+    def test_integer(self):
+        self.assertEqual(coerce(Age, ' 42 '), 42)
+        self.assertEqual(coerce(Age, 3.0), 3)
+        self.assertIsNone(coerce(Age, ''))
+        self.assertEqual(coerce(Age, '+7'), 7)
+        self.assertEqual(coerce(Age, decimal.Decimal('8')), 8)
+        for value in ('4.2', 4.2, 'abc', [], '-1', 151, decimal.Decimal('1.9'),
+                      True, False, '1_0', u'\u0663', float('nan'),
+                      float('inf'), '0x10'):
+            self.assertTrue(is_error(coerce(Age, value)), repr(value))
+        self.assertEqual(coerce(Age, 151).message,
+                         'The number is out of range.')
+
+    def test_decimal(self):
+        self.assertEqual(coerce(Price, '1.005'), decimal.Decimal('1.00'))
+        self.assertEqual(coerce(Price, 2.5), decimal.Decimal('2.50'))
+        for value in ('NaN', 'Infinity', 'abc', '-1'):
+            self.assertTrue(is_error(coerce(Price, value)), value)
+
+    def test_float(self):
+        self.assertEqual(coerce(Ratio, '0.5'), 0.5)
+        for value in ('nan', 'inf', '1.5', object()):
+            self.assertTrue(is_error(coerce(Ratio, value)), value)
+
+    def test_boolean(self):
+        self.assertIs(coerce(Active, 'ON'), True)
+        self.assertIs(coerce(Active, 'false'), False)
+        self.assertIs(coerce(Active, 1), True)
+        self.assertIs(coerce(Active, None), False)
+        self.assertTrue(is_error(coerce(Active, 'maybe')))
+
+    def test_dates(self):
+        self.assertEqual(coerce(Birthday, '2000-02-29'),
+                         datetime.date(2000, 2, 29))
+        self.assertEqual(coerce(Birthday, datetime.datetime(2000, 1, 1, 12)),
+                         datetime.date(2000, 1, 1))
+        self.assertTrue(is_error(coerce(Birthday, '2001-02-29')))
+        self.assertTrue(is_error(coerce(Birthday, '2021-01-01')))
+        self.assertEqual(coerce(EuropeanDate, '31/12/1999'),
+                         datetime.date(1999, 12, 31))
+        self.assertTrue(is_error(coerce(EuropeanDate, '1999-12-31')))
+        self.assertEqual(coerce(Created, '2000-01-01T10:20:30'),
+                         datetime.datetime(2000, 1, 1, 10, 20, 30))
+        self.assertTrue(is_error(coerce(Created, 42)))
+
+    def test_aware_datetime_against_naive_bounds(self):
+        error = coerce(Recent, '2021-01-01T00:00:00+00:00')
+        self.assertTrue(is_error(error))
+        self.assertEqual(error.message, 'The date is out of range.')
+
+        class RecentForm(Form):
+            recent = Recent
+
+        form = RecentForm({'recent': '2021-01-01T00:00:00+00:00'})
+        self.assertEqual([error.message for error in form.errors],
+                         ['The date is out of range.'])
+
+    def test_enum(self):
+        self.assertEqual(coerce(Size, 'M'), 'M')
+        self.assertTrue(is_error(coerce(Size, 'XL')))
+        self.assertTrue(is_error(coerce(Size, ['M'])))
+        self.assertIs(coerce(Paint, 'red'), Color.RED)
+        self.assertIs(coerce(Paint, Color.BLUE), Color.BLUE)
+        self.assertTrue(is_error(coerce(Paint, 'green')))
+
+    def test_strings(self):
+        self.assertEqual(coerce(Email, ' john@example.com '),
+                         'john@example.com')
+        for value in ('john', 'john@example', 'john@exa mple.com',
+                      'a@' + 'b' * 250 + '.com'):
+            self.assertTrue(is_error(coerce(Email, value)), value)
+        self.assertEqual(coerce(Email, '  ').message,
+                         'This field is required.')
+        self.assertEqual(coerce(Code, 'AB'), 'AB')
+        for value in ('A', 'ABCDE', 'ab', 12):
+            self.assertTrue(is_error(coerce(Code, value)), value)
+
+    def test_check(self):
+        class AdultForm(Form):
+            adult = Adult
+
+        for value, messages in (('42', []), ('', []), ('12', ['Too young.']),
+                                ('abc', ['Enter a whole number.'])):
+            form = AdultForm({'adult': value})
+            self.assertEqual([error.message for error in form.errors],
+                             messages)
+
+    def test_compiled_once(self):
+        coercer = Age.coerce
+        self.assertIs(Age.coerce, coercer)
+        self.assertIsNot(Age.coerce, IntegerField.coerce)
+
+
+class TypedForm(Form):
+    age = Age
+    email = Email
+    size = Size
+
+    def submit(self, age, email, size):
+        StatefulTest.world['submitted'] = (age, email, size)
+
+
+class TestTypedForm(StatefulTest):
+    def test_form(self):
+        form = TypedForm({'age': '30', 'email': 'a@b.co', 'size': 'L'})
+        self.assertEqual(form.errors, [])
+        self.assertEqual(StatefulTest.world['submitted'], (30, 'a@b.co', 'L'))
+
+    def test_errors(self):
+        form = TypedForm({'age': 'old', 'size': 'XXL'})
+        self.assertEqual([error.message for error in form.errors],
+                         ['Enter a whole number.', 'This field is required.',
+                          'Select a valid choice.'])
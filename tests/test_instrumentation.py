@@ -0,0 +1,102 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import ValidationError
+from formscribe.instrumentation import ERROR
+from formscribe.instrumentation import HistogramObserver
+from formscribe.instrumentation import Observer
+from formscribe.instrumentation import SKIPPED_DEPENDENCY
+from formscribe.instrumentation import SKIPPED_DISABLED
+from formscribe.instrumentation import SKIPPED_VALUE
+from formscribe.instrumentation import VALIDATED
+
+
+class InstrumentedForm(Form):
+    class Disabled(Field):
+        key = 'disabled'
+        enabled = False
+
+        def validate(self, value):
+            return value
+
+    class Mode(Field):
+        key = 'mode'
+
+        def validate(self, value):
+            return value
+
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            if not value:
+                raise ValidationError('Name is required.')
+            return value
+
+    class Nickname(Field):
+        key = 'nickname'
+        when_validated = ['name']
+
+        def validate(self, value):
+            return value
+
+    class Tag(Field):
+        regex_group = 'tags'
+        regex_group_key = 'tag'
+        regex_key = r'tag-(\d+)'
+        when_value = {'mode': 'tags'}
+
+        def validate(self, value):
+            return value
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.calls = []
+
+    def field_finished(self, form, field, outcome, started, finished,
+                       matches):
+        assert finished >= started
+        self.calls.append((field, outcome, matches))
+
+
+class TestObserver(unittest.TestCase):
+    def test_outcomes(self):
+        observer = RecordingObserver()
+        InstrumentedForm({'mode': 'tags', 'name': '', 'tag-1': 'a',
+                          'tag-2': 'b'}, observer=observer)
+        self.assertEqual(observer.calls, [
+            (InstrumentedForm.Disabled, SKIPPED_DISABLED, 0),
+            (InstrumentedForm.Mode, VALIDATED, 0),
+            (InstrumentedForm.Name, ERROR, 0),
+            (InstrumentedForm.Nickname, SKIPPED_DEPENDENCY, 0),
+            (InstrumentedForm.Tag, VALIDATED, 2),
+        ])
+
+    def test_when_value_mismatch(self):
+        observer = RecordingObserver()
+        InstrumentedForm({'mode': 'plain', 'tag-1': 'a'}, observer=observer)
+        self.assertTrue((InstrumentedForm.Tag, SKIPPED_VALUE, 0) in
+                        observer.calls)
+
+
+class TestHistogramObserver(unittest.TestCase):
+    def test_export(self):
+        observer = HistogramObserver(buckets=(10.0,))
+        rows = [{'mode': 'tags', 'name': 'john', 'tag-1': 'a'},
+                {'mode': 'tags', 'name': '', 'tag-1': 'a', 'tag-2': 'b'}]
+        list(InstrumentedForm.validate_many(rows, observer=observer))
+
+        stats = observer.export()
+        name = stats['InstrumentedForm.Name']
+        self.assertEqual(name['outcomes']['validated'], 1)
+        self.assertEqual(name['outcomes']['error'], 1)
+        self.assertEqual(name['histogram'], [(10.0, 2), (None, 0)])
+        self.assertEqual(stats['InstrumentedForm.Tag']['matches'], 3)
+        self.assertEqual(
+            stats['InstrumentedForm.Nickname']['outcomes']['skipped-dependency'],
+            1)
+
+        observer.reset()
+        self.assertEqual(observer.export(), {})
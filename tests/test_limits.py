@@ -0,0 +1,106 @@
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import LimitExceededError
+from tests.helpers import StatefulTest
+
+
+class LimitsForm(Form):
+    max_groups = 3
+    max_keys = 10
+
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            StatefulTest.world['validated'] += 1
+            return value
+
+    class PlayerName(Field):
+        max_matches = 2
+        regex_key = r'^player-(\d+)-name$'
+        regex_group = 'players'
+        regex_group_key = 'name'
+
+        def validate(self, value):
+            StatefulTest.world['validated'] += 1
+            return value
+
+    class PlayerScore(Field):
+        regex_key = r'^player-(\d+)-score$'
+        regex_group = 'players'
+        regex_group_key = 'score'
+
+        def validate(self, value):
+            StatefulTest.world['validated'] += 1
+            return value
+
+    def submit(self, name, players):
+        pass
+
+
+class Keys(object):
+    """Iterable counting the keys pulled out of it."""
+
+    def __init__(self, size):
+        self.size = size
+        self.pulled = 0
+
+    def __iter__(self):
+        for index in range(self.size):
+            self.pulled += 1
+            yield 'key-%d' % index
+
+    def get(self, key, default=None):
+        return default
+
+
+class TestLimits(StatefulTest):
+    def setUp(self):
+        super(TestLimits, self).setUp()
+        StatefulTest.world['validated'] = 0
+
+    def assertRejected(self, form):
+        self.assertEqual(len(form.errors), 1)
+        self.assertIsInstance(form.errors[0], LimitExceededError)
+        self.assertTrue(form.aborted)
+        self.assertFalse(form.submitted)
+        self.assertEqual(StatefulTest.world['validated'], 0)
+        self.assertEqual(form.unevaluated, form.get_schema().fields)
+
+    def test_within_limits(self):
+        form = LimitsForm({'name': 'john', 'player-1-name': 'a',
+                           'player-1-score': 1, 'player-2-name': 'b'})
+        self.assertEqual(form.errors, [])
+        self.assertTrue(form.submitted)
+
+    def test_max_keys(self):
+        data = dict(('key-%d' % index, index) for index in range(11))
+        self.assertRejected(LimitsForm(data))
+
+    def test_max_keys_stops_scan(self):
+        keys = Keys(100000)
+        self.assertRejected(LimitsForm(keys))
+        self.assertEqual(keys.pulled, 11)
+
+    def test_max_matches(self):
+        data = dict(('player-%d-name' % index, 'a') for index in range(3))
+        self.assertRejected(LimitsForm(data))
+
+    def test_max_groups(self):
+        data = dict(('player-%d-score' % index, 1) for index in range(4))
+        self.assertRejected(LimitsForm(data))
+
+    def test_kwargs(self):
+        data = dict(('player-%d-score' % index, 1) for index in range(4))
+        form = LimitsForm(data, max_groups=None)
+        self.assertEqual(form.errors, [])
+        self.assertEqual(StatefulTest.world['validated'], 5)
+
+    def test_revalidate(self):
+        form = LimitsForm({'name': 'john', 'player-1-name': 'a'})
+        StatefulTest.world['validated'] = 0
+        dirty = form.revalidate({'player-2-name': 'b',
+                                 'player-3-name': 'c'})
+        self.assertEqual(dirty, set())
+        self.assertRejected(form)
+        self.assertEqual(form.values, {})
@@ -0,0 +1,72 @@
+from formscribe import Field
+from formscribe import Form
+from formscribe import SUBMIT
+from formscribe import VALIDATE
+from formscribe import VALIDATE_FIELDS
+from formscribe.error import ValidationError
+from tests.helpers import StatefulTest
+
+
+class ModesForm(Form):
+    class Name(Field):
+        key = 'name'
+
+        def validate(self, value):
+            StatefulTest.world['phases'].append('field-validate')
+            if not value:
+                raise ValidationError('Name is required.')
+            return value
+
+        def submit(self, value):
+            StatefulTest.world['phases'].append('field-submit')
+
+    def build_kwargs(self, names=None):
+        StatefulTest.world['phases'].append('build-kwargs')
+        return super(ModesForm, self).build_kwargs(names)
+
+    def validate(self, name):
+        StatefulTest.world['phases'].append('form-validate')
+
+    def submit(self, name):
+        StatefulTest.world['phases'].append('form-submit')
+
+
+class TestModes(StatefulTest):
+    def setUp(self):
+        super(TestModes, self).setUp()
+        StatefulTest.world['phases'] = []
+
+    def test_validate_fields(self):
+        form = ModesForm({'name': 'john'}, mode=VALIDATE_FIELDS)
+        self.assertEqual(StatefulTest.world['phases'], ['field-validate'])
+        self.assertFalse(form.submitted)
+
+    def test_validate(self):
+        form = ModesForm({'name': 'john'}, mode=VALIDATE)
+        self.assertEqual(StatefulTest.world['phases'],
+                         ['field-validate', 'build-kwargs', 'form-validate'])
+        self.assertFalse(form.submitted)
+
+    def test_submit(self):
+        form = ModesForm({'name': 'john'}, mode=SUBMIT)
+        self.assertEqual(StatefulTest.world['phases'],
+                         ['field-validate', 'build-kwargs', 'form-validate',
+                          'field-submit', 'form-submit'])
+        self.assertTrue(form.submitted)
+
+    def test_errors_are_still_reported(self):
+        form = ModesForm({'name': ''}, mode=VALIDATE_FIELDS)
+        self.assertEqual(form.errors[0].message, 'Name is required.')
+
+    def test_revalidate(self):
+        form = ModesForm({'name': ''}, mode=VALIDATE_FIELDS)
+        form.revalidate({'name': 'john'})
+        self.assertEqual(StatefulTest.world['phases'],
+                         ['field-validate', 'field-validate'])
+        self.assertEqual(form.errors, [])
+
+    def test_batch(self):
+        rows = [{'name': 'john'}, {'name': 'mary'}]
+        results = list(ModesForm.validate_many(rows, mode=VALIDATE))
+        self.assertFalse(any(result.submitted for result in results))
+        self.assertFalse('field-submit' in StatefulTest.world['phases'])
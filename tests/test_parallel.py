@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import SubmitError
+from formscribe.error import ValidationError
+from formscribe.parallel import get_import_path
+from formscribe.result import Result
+
+
+class ParallelForm(Form):
+    class Number(Field):
+        key = 'number'
+
+        def validate(self, value):
+            if value % 7 == 0:
+                raise ValidationError('Multiple of 7.')
+            return value * 2
+
+    def submit(self, number):
+        if number % 5 == 0:
+            raise SubmitError('Multiple of 5.')
+
+
+class TestParallel(unittest.TestCase):
+    def rows(self):
+        return [{'number': number} for number in range(1, 51)]
+
+    def expected(self):
+        return [(result.values, [error.message for error in result.errors],
+                 result.submitted)
+                for result in ParallelForm.validate_many(self.rows())]
+
+    def test_ordered(self):
+        results = ParallelForm.validate_parallel(self.rows(), processes=2,
+                                                 chunk_size=7)
+        self.assertEqual([(result.values,
+                           [error.message for error in result.errors],
+                           result.submitted) for result in results],
+                         self.expected())
+
+    def test_unordered(self):
+        results = sorted(ParallelForm.validate_parallel(
+            self.rows(), processes=2, chunk_size=7, ordered=False),
+            key=lambda item: item[0])
+        self.assertEqual([index for index, _ in results], list(range(50)))
+        self.assertEqual([(result.values,
+                           [error.message for error in result.errors],
+                           result.submitted) for _, result in results],
+                         self.expected())
+
+    def test_local_form(self):
+        class LocalForm(Form):
+            pass
+
+        self.assertRaises(ValueError, get_import_path, LocalForm)
+        # raised by the call itself, before any result is consumed
+        self.assertRaises(ValueError, LocalForm.validate_parallel, [{}])
+        self.assertEqual(get_import_path(ParallelForm),
+                         'tests.test_parallel:ParallelForm')
+
+    def test_pickling(self):
+        result = Result({'number': 1}, [ValidationError('1'),
+                                        SubmitError('2')], False)
+        loaded = pickle.loads(pickle.dumps(result))
+        self.assertEqual(loaded.values, {'number': 1})
+        self.assertTrue(isinstance(loaded.errors[0], ValidationError))
+        self.assertEqual(loaded.errors[0].message, '1')
+        self.assertTrue(isinstance(loaded.errors[1], SubmitError))
+        self.assertEqual(loaded.errors[1].message, '2')
+        self.assertFalse(loaded.submitted)
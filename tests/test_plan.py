@@ -0,0 +1,80 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import InvalidFieldError
+
+
+class PlanForm(Form):
+    class A(Field):
+        key = 'a'
+        when_validated = ['c']
+
+        def validate(self, value):
+            return value
+
+    class B(Field):
+        key = 'b'
+
+        def validate(self, value):
+            return value
+
+    class C(Field):
+        key = 'c'
+        when_value = {'b': 'yes'}
+
+        def validate(self, value):
+            return value
+
+
+class TestPlan(unittest.TestCase):
+    def test_dependencies_come_first(self):
+        self.assertEqual(PlanForm.get_schema().plan,
+                         [PlanForm.B, PlanForm.C, PlanForm.A])
+
+    def test_unknown_dependency(self):
+        def define():
+            class UnknownDependencyForm(Form):
+                class A(Field):
+                    key = 'a'
+                    when_validated = ['missing']
+
+        self.assertRaises(InvalidFieldError, define)
+
+    def test_circular_dependency(self):
+        def define():
+            class CircularForm(Form):
+                class A(Field):
+                    key = 'a'
+                    when_validated = ['b']
+
+                class B(Field):
+                    key = 'b'
+                    when_value = {'a': 1}
+
+        self.assertRaises(InvalidFieldError, define)
+
+    def test_self_dependency(self):
+        def define():
+            class SelfDependentForm(Form):
+                class A(Field):
+                    key = 'a'
+                    when_validated = ['a']
+
+        self.assertRaises(InvalidFieldError, define)
+
+    def test_long_chain(self):
+        attributes = {}
+        for index in range(2000):
+            attributes['F%05d' % index] = type(
+                'F%05d' % index, (Field,),
+                {'key': str(index),
+                 'when_validated': [str(index + 1)] if index < 1999 else [],
+                 'validate': lambda self, value: value})
+        ChainForm = type('ChainForm', (Form,), attributes)
+
+        plan = ChainForm.get_schema().plan
+        self.assertEqual([field.key for field in plan],
+                         [str(index) for index in reversed(range(2000))])
+        form = ChainForm(dict((str(index), index) for index in range(2000)))
+        self.assertFalse(form.errors)
@@ -0,0 +1,105 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import ValidationError
+from formscribe.util import Overlay
+from tests.helpers import StatefulTest
+
+
+def counted(name, **attributes):
+    def validate(self, value):
+        StatefulTest.world['calls'].append(name)
+        if not value:
+            raise ValidationError('%s is required.' % name)
+        return value
+
+    attributes['validate'] = validate
+    return type(name, (Field,), attributes)
+
+
+class LiveForm(Form):
+    Country = counted('Country', key='country')
+    State = counted('State', key='state', when_value={'country': 'US'})
+    City = counted('City', key='city', when_validated=['state'])
+    Email = counted('Email', key='email')
+    PhoneNumber = counted('PhoneNumber', regex_group='phones',
+                          regex_group_key='number',
+                          regex_key=r'phone-(\d+)-number')
+    PhoneKind = counted('PhoneKind', regex_group='phones',
+                        regex_group_key='kind',
+                        regex_key=r'phone-(\d+)-kind')
+
+    def validate(self, country, state, city, email, phones):
+        StatefulTest.world['form_validations'] += 1
+
+
+class TestRevalidate(StatefulTest):
+    data = {
+        'city': 'Austin',
+        'country': 'US',
+        'email': '',
+        'phone-1-kind': 'home',
+        'phone-1-number': '123',
+        'state': 'TX',
+    }
+
+    def setUp(self):
+        super(TestRevalidate, self).setUp()
+        StatefulTest.world['calls'] = []
+        StatefulTest.world['form_validations'] = 0
+        self.form = LiveForm(self.data)
+        StatefulTest.world['calls'] = []
+
+    def test_independent_field(self):
+        dirty = self.form.revalidate({'email': 'john@example.com'})
+        self.assertEqual(dirty, set([LiveForm.Email]))
+        self.assertEqual(StatefulTest.world['calls'], ['Email'])
+        self.assertEqual(self.form.errors, [])
+        self.assertEqual(StatefulTest.world['form_validations'], 2)
+
+    def test_transitive_dependents(self):
+        self.form.revalidate({'country': 'BR'})
+        self.assertEqual(sorted(StatefulTest.world['calls']),
+                         ['City', 'Country'])
+        self.assertEqual(self.form.values[LiveForm.State], None)
+
+        StatefulTest.world['calls'] = []
+        self.form.revalidate({'country': 'US', 'state': ''})
+        self.assertEqual(sorted(StatefulTest.world['calls']),
+                         ['Country', 'State'])
+        # fields follow the schema's plan, where State comes before Email
+        self.assertEqual([error.message for error in self.form.errors],
+                         ['State is required.', 'Email is required.'])
+
+    def test_errors_keep_field_order(self):
+        self.form.revalidate({'city': ''})
+        self.assertEqual([error.message for error in self.form.errors],
+                         ['City is required.', 'Email is required.'])
+
+    def test_regex_group(self):
+        self.form.revalidate({'phone-2-number': '456'})
+        self.assertEqual(sorted(StatefulTest.world['calls']),
+                         ['PhoneKind', 'PhoneNumber', 'PhoneNumber'])
+        self.assertEqual(sorted(self.form.regex_values['phones']),
+                         [('1',), ('2',)])
+        self.assertEqual(self.form.regex_values['phones'][('2',)]['number'],
+                         '456')
+
+    def test_data_is_not_modified(self):
+        data = dict(self.data)
+        form = LiveForm(data)
+        form.revalidate({'email': 'john@example.com', 'extra': 1})
+        self.assertEqual(data, self.data)
+        self.assertEqual(form.data['email'], 'john@example.com')
+        self.assertFalse(form.submitted)
+
+
+class TestOverlay(unittest.TestCase):
+    def test_overlay(self):
+        overlay = Overlay(Overlay({'a': 1, 'b': 2}, {'b': 3}), {'c': 4})
+        self.assertEqual(overlay.base, {'a': 1, 'b': 2})
+        self.assertEqual(sorted(overlay.items()),
+                         [('a', 1), ('b', 3), ('c', 4)])
+        self.assertEqual(overlay.get('d'), None)
+        self.assertTrue('c' in overlay)
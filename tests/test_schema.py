@@ -0,0 +1,67 @@
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+
+
+class SchemaForm(Form):
+    class Username(Field):
+        key = 'username'
+
+        def validate(self, value):
+            return value
+
+    class Password(Field):
+        key = 'password'
+        when_validated = ['username']
+
+        def validate(self, value):
+            return value
+
+    class PlayerName(Field):
+        regex_group = 'players'
+        regex_group_key = 'name'
+        regex_key = r'player-(\d+)-name'
+
+        def validate(self, value):
+            return value
+
+
+class ExtendedSchemaForm(SchemaForm):
+    class Email(Field):
+        key = 'email'
+
+        def validate(self, value):
+            return value
+
+
+class TestSchema(unittest.TestCase):
+    def test_shared_between_instances(self):
+        first = SchemaForm({})
+        second = SchemaForm({'username': 'foo'})
+        self.assertTrue(first.get_schema() is second.get_schema())
+
+    def test_fields(self):
+        schema = SchemaForm.get_schema()
+        self.assertEqual(schema.fields, [SchemaForm.Password,
+                                         SchemaForm.PlayerName,
+                                         SchemaForm.Username])
+        self.assertEqual(schema.key_index, {
+            'password': SchemaForm.Password,
+            'username': SchemaForm.Username,
+        })
+        self.assertEqual(schema.regex_fields, [SchemaForm.PlayerName])
+        self.assertEqual(schema.regex_groups, ['players'])
+
+    def test_dependencies(self):
+        schema = SchemaForm.get_schema()
+        self.assertEqual(schema.dependencies[SchemaForm.Password],
+                         [SchemaForm.Username])
+        self.assertEqual(schema.dependencies[SchemaForm.Username], [])
+
+    def test_subclass_has_its_own_schema(self):
+        schema = ExtendedSchemaForm.get_schema()
+        self.assertFalse(schema is SchemaForm.get_schema())
+        self.assertTrue(ExtendedSchemaForm.Email in schema.fields)
+        self.assertFalse(ExtendedSchemaForm.Email in
+                         SchemaForm.get_schema().fields)
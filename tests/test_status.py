@@ -0,0 +1,82 @@
+import pickle
+import unittest
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.error import ValidationError
+from formscribe.result import ERROR
+from formscribe.result import NOT_EVALUATED
+from formscribe.result import SKIPPED_DEPENDENCY
+from formscribe.result import SKIPPED_DISABLED
+from formscribe.result import VALIDATED
+
+
+class StatusForm(Form):
+    class Age(Field):
+        key = 'age'
+
+        def validate(self, value):
+            if not value.isdigit():
+                # errors may be returned instead of raised
+                return ValidationError('Invalid age.')
+            return int(value)
+
+    class Disabled(Field):
+        key = 'disabled'
+        enabled = False
+
+    class Retirement(Field):
+        key = 'retirement'
+        when_validated = ['age']
+
+        def validate(self, value):
+            return value
+
+    class Tag(Field):
+        regex_group = 'tags'
+        regex_group_key = 'tag'
+        regex_key = r'tag-(\d+)'
+
+        def validate(self, value):
+            if not value:
+                return ValidationError('Empty tag.')
+            return value
+
+
+class TestStatus(unittest.TestCase):
+    def test_returned_errors(self):
+        form = StatusForm({'age': 'x', 'tag-1': '', 'tag-2': 'b'})
+        self.assertEqual([error.message for error in form.errors],
+                         ['Invalid age.', 'Empty tag.'])
+        self.assertEqual(form.values[StatusForm.Age], None)
+        self.assertEqual(list(form.regex_values['tags']), [('2',)])
+        self.assertEqual(form.regex_values['tags'][('2',)]['tag'], 'b')
+
+    def test_status(self):
+        form = StatusForm({'age': 'x', 'tag-1': 'a'})
+        self.assertEqual(form.get_status(StatusForm.Age), ERROR)
+        self.assertEqual(form.get_status(StatusForm.Disabled),
+                         SKIPPED_DISABLED)
+        self.assertEqual(form.get_status(StatusForm.Retirement),
+                         SKIPPED_DEPENDENCY)
+        self.assertEqual(form.get_status(StatusForm.Tag), VALIDATED)
+        self.assertEqual(form.validated, set([StatusForm.Age,
+                                              StatusForm.Retirement,
+                                              StatusForm.Tag]))
+        self.assertEqual(form.invalidated, set([StatusForm.Age]))
+
+    def test_result_status(self):
+        rows = [{'age': '30', 'retirement': '65'}]
+        result = list(StatusForm.validate_many(rows))[0]
+        positions = StatusForm.get_schema().positions
+        self.assertEqual(result.status[positions[StatusForm.Retirement]],
+                         VALIDATED)
+        self.assertEqual(result.status[positions[StatusForm.Disabled]],
+                         SKIPPED_DISABLED)
+        self.assertEqual(pickle.loads(pickle.dumps(result)).status,
+                         result.status)
+
+    def test_not_evaluated_by_default(self):
+        form = StatusForm.__new__(StatusForm)
+        form.reset({})
+        self.assertEqual(form.get_status(StatusForm.Age), NOT_EVALUATED)
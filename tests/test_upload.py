@@ -0,0 +1,120 @@
+import hashlib
+import io
+
+from formscribe import Field
+from formscribe import Form
+from formscribe.upload import Upload
+from formscribe.upload import UploadField
+from tests.helpers import StatefulTest
+from tests.test_body import multipart
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 4096
+
+
+class UploadForm(Form):
+    class Avatar(UploadField):
+        key = 'avatar'
+        max_size = 2 * 1024 * 1024
+        signatures = (b'\x89PNG\r\n\x1a\n',)
+        hash_algorithm = 'sha256'
+        spool_size = 1024
+
+    class Attachment(Field):
+        key = 'attachment'
+
+        def validate(self, value):
+            return value
+
+    def submit(self, avatar, attachment):
+        StatefulTest.world['avatar'] = avatar
+        StatefulTest.world['attachment'] = attachment
+
+
+def build_body(avatar, attachment=b'text'):
+    return multipart([
+        (['Content-Disposition: form-data; name="avatar";'
+          ' filename="avatar.png"', 'Content-Type: image/png'], avatar),
+        (['Content-Disposition: form-data; name="attachment";'
+          ' filename="notes.txt"'], attachment),
+    ])
+
+
+class TestUpload(StatefulTest):
+    def test_single_pass(self):
+        upload = Upload('a.bin', 'application/octet-stream',
+                        hash_algorithm='md5', head_size=4, spool_size=8)
+        for chunk in (b'ab', b'cdef', b'ghijkl'):
+            upload.write(memoryview(chunk))
+        self.assertEqual(upload.size, 12)
+        self.assertEqual(upload.head, b'abcd')
+        self.assertEqual(upload.digest, hashlib.md5(b'abcdefghijkl')
+                         .hexdigest())
+        upload.seek(0)
+        self.assertEqual(list(upload.chunks(5)), [b'abcde', b'fghij', b'kl'])
+        mapped = upload.mmap()
+        self.assertEqual(mapped[:], b'abcdefghijkl')
+        mapped.close()
+        upload.close()
+
+    def test_max_size(self):
+        upload = Upload(max_size=4)
+        upload.write(b'abc')
+        upload.write(b'def')
+        upload.write(b'ghi')
+        self.assertTrue(upload.exceeded)
+        self.assertEqual(upload.size, 9)
+        upload.seek(0)
+        self.assertEqual(upload.read(), b'abc')
+
+    def test_from_body(self):
+        form = UploadForm.from_body(io.BytesIO(build_body(PNG)),
+                                    'multipart/form-data; boundary=boundary')
+        self.assertEqual(form.errors, [])
+        avatar = StatefulTest.world['avatar']
+        self.assertIsInstance(avatar, Upload)
+        self.assertEqual(avatar.filename, 'avatar.png')
+        self.assertEqual(avatar.content_type, 'image/png')
+        self.assertEqual(avatar.digest, hashlib.sha256(PNG).hexdigest())
+        self.assertTrue(avatar.file._rolled)
+        self.assertEqual(avatar.read(), PNG)
+        # files sent for any other field are spooled as well
+        self.assertEqual(StatefulTest.world['attachment'].read(), b'text')
+
+    def test_rejected(self):
+        form = UploadForm.from_body(build_body(b'GIF89a'),
+                                    'multipart/form-data; boundary=boundary')
+        self.assertEqual([error.message for error in form.errors],
+                         ['The file type is not allowed.'])
+
+        form = UploadForm.from_body(build_body(PNG * 1024),
+                                    'multipart/form-data; boundary=boundary')
+        self.assertEqual([error.message for error in form.errors],
+                         ['The file is too large.'])
+
+    def test_part_without_filename(self):
+        body = multipart([
+            (['Content-Disposition: form-data; name="avatar"'],
+             PNG * 1024),
+            (['Content-Disposition: form-data; name="attachment"'], b'text'),
+        ])
+        form = UploadForm.from_body(io.BytesIO(body),
+                                    'multipart/form-data; boundary=boundary')
+        self.assertEqual([error.message for error in form.errors],
+                         ['The file is too large.'])
+
+        body = multipart([
+            (['Content-Disposition: form-data; name="avatar"'], PNG),
+            (['Content-Disposition: form-data; name="attachment"'], b'text'),
+        ])
+        form = UploadForm.from_body(io.BytesIO(body),
+                                    'multipart/form-data; boundary=boundary')
+        self.assertEqual(form.errors, [])
+        self.assertIsNone(StatefulTest.world['avatar'].filename)
+        self.assertEqual(StatefulTest.world['avatar'].read(), PNG)
+        # parts that are neither files nor uploads are read as text
+        self.assertEqual(StatefulTest.world['attachment'], 'text')
+
+    def test_not_a_file(self):
+        form = UploadForm({'avatar': 'text'})
+        self.assertEqual([error.message for error in form.errors],
+                         ['A file is expected.'])